@@ -6,7 +6,7 @@ __init__.py for controller package
 """
 
 # Import all controller classes for easier access
-from .file_controller import FileController
+from .file_controller import FileController, FormatInfo
 from .export_controller import ExportController
 from .frame_controller import FrameController
 from .image_controller import ImageController
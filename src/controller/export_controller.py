@@ -53,7 +53,8 @@ class ExportController:
         return self.file_manager.get_export_directory()
     
     def export_frames(self, frames: List[Dict[str, Any]], export_dir: str, 
-                     export_settings: Dict[str, Any], progress_callback=None) -> Tuple[bool, str]:
+                     export_settings: Dict[str, Any], progress_callback=None,
+                     buffer_pool=None) -> Tuple[bool, str]:
         """
         Export frames with specified settings.
         
@@ -66,22 +67,11 @@ class ExportController:
                 - crop: Boolean indicating whether to crop
                 - crop_params: Dictionary with crop parameters (top, left, width, height)
                 - on_duplicate: Action for duplicate files ('overwrite', 'skip', 'unique')
+                - export_metadata: Boolean indicating whether to write metadata JSON
+                - metadata_mode: 'combined' (one {file}_metadata.json per source file, written
+                  after all frames) or 'per_frame' (one JSON next to every frame)
             progress_callback: Optional callback function to report progress (float 0-1)
-            
-        Returns:
-            Tuple[bool, str]: (Success, Message)
-        """
-        """
-        Export frames with specified settings.
-        
-        Args:
-            frames: List of frame information dictionaries
-            export_dir: Directory to export frames to
-            export_settings: Dictionary with export settings
-                - format: Export format (PNG, JPEG, TIFF, DICOM)
-                - rotation: Rotation angle (0°, 90°, 180°, 270°)
-                - crop: Boolean indicating whether to crop
-                - crop_params: Dictionary with crop parameters (top, left, width, height)
+            buffer_pool: Optional FrameBufferPool supplying the per-frame conversion buffers
             
         Returns:
             Tuple[bool, str]: (Success, Message)
@@ -95,8 +85,13 @@ class ExportController:
         # Set export directory
         self.file_manager.set_export_directory(export_dir)
         
-        # Get duplicate handling option
+        # Determine export format and duplicate handling option once for all frames
+        export_format = export_settings.get('format', 'PNG')
         on_duplicate = export_settings.get('on_duplicate', 'overwrite')
+        export_metadata = export_settings.get('export_metadata', False)
+        metadata_mode = export_settings.get('metadata_mode', 'combined')
+        # file_name -> {'metadata': ..., 'frames': [...]} for combined metadata
+        combined_metadata = {}
         logger.info(f"Using duplicate file handling: {on_duplicate}")
         logger.info(f"Full export settings: {export_settings}")
         
@@ -113,6 +108,7 @@ class ExportController:
                 if not progress_callback(i / total_frames):
                     logger.info("Export canceled by user")
                     return False, "Export canceled by user"
+            pooled_buffers = []
             try:
                 # Get file name and frame ID
                 file_name = frame.get('file_name', '')
@@ -142,16 +138,31 @@ class ExportController:
                 # Ensure the image data is in the correct format for saving
                 if image_data.dtype != np.uint8 and export_format != 'DICOM':
                     logger.info(f"Converting {frame_id} from {image_data.dtype} to uint8")
-                    # Normalize to 0-255 range for proper display
-                    image_data = ((image_data - image_data.min()) / 
-                                (image_data.max() - image_data.min() + 1e-10) * 255).astype(np.uint8)
+                    # Normalize to 0-255 range for proper display; vectorized in-place
+                    # ufuncs on one float32 copy (the reader's array is left untouched)
+                    vmin = float(image_data.min())
+                    vmax = float(image_data.max())
+                    if buffer_pool is not None:
+                        # Convert through pooled buffers, reused across frames and files
+                        normalized = buffer_pool.acquire(image_data.shape, np.float32)
+                        converted = buffer_pool.acquire(image_data.shape, np.uint8)
+                        pooled_buffers.extend((normalized, converted))
+                        np.subtract(image_data, vmin, out=normalized, dtype=np.float32)
+                    else:
+                        normalized = image_data.astype(np.float32)
+                        normalized -= vmin
+                        converted = None
+                    normalized *= np.float32(255.0 / (vmax - vmin + 1e-10))
+                    if converted is None:
+                        image_data = normalized.astype(np.uint8)
+                    else:
+                        np.copyto(converted, normalized, casting='unsafe')
+                        image_data = converted
                 
                 # Process image if image controller is available
                 if self.image_controller:
                     image_data = self.image_controller.process_image(image_data, export_settings)
                 
-                # Determine export format
-                export_format = export_settings.get('format', 'PNG')
                 if export_format == 'DICOM':
                     # For DICOM export, use OCT-Converter's DICOM export
                     success, msg = self.oct_reader.export_to_dicom(file_name, export_dir)
@@ -191,40 +202,42 @@ class ExportController:
                         continue
                     
                     # Export DICOM metadata if requested (only for successful saves)
-                    if success and export_settings.get('export_metadata', False):
-                            try:
-                                # Get detailed metadata for the file
-                                file_path = frame.get('file_path')
-                                if file_path and file_path in self.oct_reader.loaded_files:
-                                    file_obj = self.oct_reader.loaded_files[file_path]
-                                    
-                                    # Check if the object has DICOM metadata
-                                    metadata_to_export = None
-                                    if hasattr(file_obj, 'dicom_metadata') and file_obj.dicom_metadata:
-                                        metadata_to_export = file_obj.dicom_metadata
-                                    elif hasattr(file_obj, 'metadata') and file_obj.metadata:
-                                        metadata_to_export = file_obj.metadata
-                                    
-                                    if metadata_to_export:
-                                        # Create metadata file path
-                                        metadata_file = os.path.join(
-                                            export_dir,
-                                            f"{os.path.splitext(file_name)[0]}_{frame_id}_metadata.json"
-                                        )
-                                        
-                                        # Save metadata as JSON
-                                        with open(metadata_file, 'w') as f:
-                                            json.dump(metadata_to_export, f, indent=2, default=str)
-                                        
-                                        logger.info(f"Saved metadata to {metadata_file}")
-                            except Exception as e:
-                                logger.warning(f"Failed to export metadata for {frame_id}: {e}")
+                    if export_metadata:
+                        if metadata_mode == 'combined':
+                            entry = combined_metadata.get(file_name)
+                            if entry is None:
+                                entry = combined_metadata[file_name] = {
+                                    'metadata': self._get_export_metadata(frame),
+                                    'frames': []
+                                }
+                            entry['frames'].append({'id': frame_id, 'path': saved_path})
+                        else:
+                            self._write_metadata(
+                                self._get_export_metadata(frame),
+                                os.path.join(
+                                    export_dir,
+                                    f"{os.path.splitext(file_name)[0]}_{frame_id}_metadata.json"
+                                )
+                            )
             
             except Exception as e:
                 error_count += 1
                 error_message = f"Error processing frame: {str(e)}"
                 error_messages.append(error_message)
                 logger.exception(f"Exception while processing frame: {e}")
+            
+            finally:
+                # The frame has been saved, so its buffers can be reused
+                for buffer in pooled_buffers:
+                    buffer_pool.release(buffer)
+        
+        # Write the deferred per-file metadata sidecars
+        for file_name, entry in combined_metadata.items():
+            if entry['metadata']:
+                self._write_metadata(
+                    entry,
+                    os.path.join(export_dir, f"{os.path.splitext(file_name)[0]}_metadata.json")
+                )
         
         # Final progress update
         if progress_callback and callable(progress_callback):
@@ -245,6 +258,45 @@ class ExportController:
             logger.warning(result_message)
             return False, result_message
     
+    def _get_export_metadata(self, frame: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Get the metadata to export for a frame's source file.
+        
+        Args:
+            frame: Frame information dictionary
+            
+        Returns:
+            Optional[Dict[str, Any]]: DICOM metadata, else reader metadata, else None
+        """
+        file_path = frame.get('file_path')
+        if not file_path or file_path not in self.oct_reader.loaded_files:
+            return None
+        file_obj = self.oct_reader.loaded_files[file_path]
+        
+        # Check if the object has DICOM metadata
+        if hasattr(file_obj, 'dicom_metadata') and file_obj.dicom_metadata:
+            return file_obj.dicom_metadata
+        if hasattr(file_obj, 'metadata') and file_obj.metadata:
+            return file_obj.metadata
+        return None
+    
+    def _write_metadata(self, metadata: Optional[Dict[str, Any]], metadata_file: str):
+        """
+        Write metadata as JSON, logging rather than raising on failure.
+        
+        Args:
+            metadata: Metadata to write; nothing is written if empty
+            metadata_file: Path of the JSON file
+        """
+        if not metadata:
+            return
+        try:
+            with open(metadata_file, 'w') as f:
+                json.dump(metadata, f, indent=2, default=str)
+            logger.info(f"Saved metadata to {metadata_file}")
+        except Exception as e:
+            logger.warning(f"Failed to export metadata to {metadata_file}: {e}")
+    
     def export_to_dicom(self, file_name: str, export_dir: str) -> Tuple[bool, str]:
         """
         Export an OCT file to DICOM format.
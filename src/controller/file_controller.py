@@ -8,7 +8,32 @@ Controls file import operations for the OCT Image Extraction application.
 """
 
 import os
-from typing import Tuple, List, Dict, Any, Optional
+import stat
+import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, List, Dict, Any, Optional, NamedTuple
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# (offset, magic bytes) for formats with a known signature; other formats are
+# only checked for being readable and non-empty. DICOM is left out because the
+# preamble and DICM prefix are optional and some exporters omit them
+_FORMAT_MAGIC = {
+    'e2e': (0, b'CMDb'),
+    'fds': (0, b'FOCT'),
+    'fda': (0, b'FOCT'),
+}
+
+
+class FormatInfo(NamedTuple):
+    """Result of probing one file before import."""
+    file_type: str
+    size: int
+    mtime: float
+    header: bytes
+
 
 class FileController:
     """Controller class for file operations."""
@@ -24,16 +49,92 @@ class FileController:
         self.oct_reader = oct_reader
         self.file_manager = file_manager
     
-    def import_file(self, file_path: str) -> Tuple[bool, str]:
+    # Bytes read from the start of each file while probing
+    PROBE_HEADER_SIZE = 512
+    
+    # Threads used to probe files in parallel
+    PROBE_WORKERS = 4
+    
+    def _probe_one(self, file_path: str) -> Tuple[Optional[FormatInfo], Optional[str]]:
+        """
+        Stat a file, read its header and check it against the expected format.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            Tuple[Optional[FormatInfo], Optional[str]]: (Format info, Error message)
+        """
+        file_name = os.path.basename(file_path)
+        if not self.oct_reader.is_supported_file(file_path):
+            return None, f"Unsupported file format: {file_name}"
+        try:
+            st = os.stat(file_path)
+            if not stat.S_ISREG(st.st_mode):
+                return None, f"Not a file: {file_path}"
+            if st.st_size == 0:
+                return None, f"Empty file: {file_name}"
+            with open(file_path, 'rb') as f:
+                header = f.read(self.PROBE_HEADER_SIZE)
+        except OSError as e:
+            return None, f"File access error: {file_name}: {e}"
+        
+        file_type = self.oct_reader.get_file_type(file_path)
+        magic = _FORMAT_MAGIC.get(file_type)
+        if magic is not None:
+            offset, expected = magic
+            if header[offset:offset + len(expected)] != expected:
+                return None, f"Not a valid {file_type.upper()} file: {file_name}"
+        
+        return FormatInfo(file_type, st.st_size, st.st_mtime, header), None
+    
+    def probe_files(self, file_paths: List[str]) -> Tuple[Dict[str, FormatInfo], Dict[str, str]]:
+        """
+        Probe a list of files in parallel ahead of importing them.
+        
+        Each file is stat'ed once and its first header bytes are read and
+        checked against the format's magic bytes where one is known. This
+        replaces the per-file validation and format detection in import_file
+        and lets unreadable or corrupt files be dropped before import.
+        
+        Args:
+            file_paths: List of file paths
+            
+        Returns:
+            Tuple[Dict[str, FormatInfo], Dict[str, str]]: (Format info by file path
+                for files that passed, Error message by file path for files that failed)
+        """
+        probed = {}
+        errors = {}
+        type_counts = Counter()
+        
+        with ThreadPoolExecutor(max_workers=self.PROBE_WORKERS) as executor:
+            results = executor.map(self._probe_one, file_paths)
+            for file_path, (info, error_message) in zip(file_paths, results):
+                if info is None:
+                    logger.warning("Preflight failed for %s: %s", file_path, error_message)
+                    errors[file_path] = error_message
+                else:
+                    probed[file_path] = info
+                    type_counts[info.file_type] += 1
+        
+        logger.info("Probed %d of %d files: %s", len(probed), len(file_paths), dict(type_counts))
+        return probed, errors
+    
+    def import_file(self, file_path: str, hint: Optional[FormatInfo] = None) -> Tuple[bool, str]:
         """
         Import an OCT file.
         
         Args:
             file_path: Path to the file
+            hint: FormatInfo from probe_files; skips validation and format detection
             
         Returns:
             Tuple[bool, str]: (Success, Message)
         """
+        if hint is not None:
+            return self.oct_reader.load_file(file_path, file_type=hint.file_type)
+        
         # Validate file path
         valid, message = self.file_manager.validate_file_path(file_path)
         if not valid:
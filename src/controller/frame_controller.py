@@ -8,7 +8,7 @@ Controls frame selection operations for the OCT Image Extraction application.
 """
 
 import os
-from typing import Tuple, List, Dict, Any, Optional
+from typing import Tuple, List, Dict, Any, Optional, Sequence
 
 class FrameController:
     """Controller class for frame operations."""
@@ -23,7 +23,7 @@ class FrameController:
         self.oct_reader = oct_reader
         self.selected_frames = {}  # Dictionary to store selected frames by file
     
-    def get_available_frames(self, file_name: str) -> List[Dict[str, Any]]:
+    def get_available_frames(self, file_name: str) -> Sequence[Dict[str, Any]]:
         """
         Get a list of available frames in a file.
         
@@ -31,15 +31,10 @@ class FrameController:
             file_name: Name of the loaded file
             
         Returns:
-            List[Dict[str, Any]]: List of frame information dictionaries
+            Sequence[Dict[str, Any]]: Frame information dictionaries
         """
-        frames = self.oct_reader.get_frames(file_name)
-        
-        # Add file name to each frame for reference
-        for frame in frames:
-            frame['file_name'] = file_name
-        
-        return frames
+        # Frame dictionaries already carry the file name for reference
+        return self.oct_reader.get_frames(file_name)
     
     def select_frame(self, file_name: str, frame_id: str) -> bool:
         """
@@ -164,6 +159,18 @@ class FrameController:
             Tuple[Optional[str], Optional[str]]: (Preview image path, Metadata string)
         """
         return self.oct_reader.get_preview(file_name)
+    
+    def get_preview_bytes(self, file_name: str) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        Get a PNG-encoded preview image and metadata for a loaded file.
+        
+        Args:
+            file_name: Name of the loaded file
+            
+        Returns:
+            Tuple[Optional[bytes], Optional[str]]: (Preview PNG bytes, Metadata string)
+        """
+        return self.oct_reader.get_preview_bytes(file_name)
         
     def get_detailed_metadata(self, file_name: str) -> Optional[Dict[str, Any]]:
         """
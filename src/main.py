@@ -49,6 +49,7 @@ logger.info("Application starting")
 from model.oct_file_reader import OCTFileReader
 from model.image_processor import ImageProcessor
 from model.file_manager import FileManager
+from model.frame_buffer_pool import FrameBufferPool
 from controller.file_controller import FileController
 from controller.export_controller import ExportController
 from controller.frame_controller import FrameController
@@ -56,7 +57,7 @@ from controller.image_controller import ImageController
 from view.import_dialog import ImportDialog
 from view.frame_selector import FrameSelector
 from view.export_dialog import ExportDialog
-from view.settings_dialog import SettingsDialog
+from view.settings_dialog import SettingsDialog, wait_for_settings_writes
 
 class MainWindow(QMainWindow):
     """Main application window."""
@@ -68,6 +69,7 @@ class MainWindow(QMainWindow):
         self.file_manager = FileManager()
         self.oct_reader = OCTFileReader()
         self.image_processor = ImageProcessor()
+        self.frame_buffer_pool = FrameBufferPool()
         
         # Initialize controllers - make sure to initialize image_controller first
         self.file_controller = FileController(self.oct_reader, self.file_manager)
@@ -357,11 +359,12 @@ class MainWindow(QMainWindow):
         file_name = selected_items[0].text()
         try:
             # Use frame controller to get preview
-            preview_image, metadata = self.frame_controller.get_preview(file_name)
+            preview_image, metadata = self.frame_controller.get_preview_bytes(file_name)
             
             if preview_image:
                 # Display preview image
-                pixmap = QPixmap(preview_image)
+                pixmap = QPixmap()
+                pixmap.loadFromData(preview_image, "PNG")
                 self.preview_label.setPixmap(pixmap.scaled(
                     self.preview_label.width(), 
                     self.preview_label.height(),
@@ -718,9 +721,8 @@ class MainWindow(QMainWindow):
         
     def update_selection_info(self):
         """Update information about selected frames."""
-        # Get selected frames
-        selected_frames = self.frame_selector.selected_frames
-        num_selected = len(selected_frames)
+        # Get the number of selected frames
+        num_selected = self.frame_selector.selected_count()
         
         # Update status bar with selection info
         if num_selected == 0:
@@ -754,7 +756,8 @@ class MainWindow(QMainWindow):
         dialog = BatchDialog(
             self,
             file_controller=self.file_controller,
-            export_controller=self.export_controller
+            export_controller=self.export_controller,
+            buffer_pool=self.frame_buffer_pool
         )
         dialog.exec_()
     
@@ -811,19 +814,8 @@ class MainWindow(QMainWindow):
             row = self.file_list.row(selected_item)
             self.file_list.takeItem(row)
             
-            # Clean up resources if needed
-            file_path = self.file_controller.oct_reader.file_paths.get(file_name)
-            if file_path:
-                # Remove from loaded files dict
-                if file_path in self.file_controller.oct_reader.loaded_files:
-                    del self.file_controller.oct_reader.loaded_files[file_path]
-                
-                # Remove from file paths dict
-                del self.file_controller.oct_reader.file_paths[file_name]
-                
-                # Remove from metadata dict
-                if file_name in self.file_controller.oct_reader.file_metadata:
-                    del self.file_controller.oct_reader.file_metadata[file_name]
+            # Clean up resources held by the reader for this file
+            self.file_controller.oct_reader.close_file(file_name)
             
             # Clear frame selector if no files remain
             if self.file_list.count() == 0:
@@ -872,6 +864,8 @@ def main():
     try:
         logger.info("Initializing application")
         app = QApplication(sys.argv)
+        # Settings are written on a background thread; don't exit before they land
+        app.aboutToQuit.connect(wait_for_settings_writes)
         
         logger.info("Creating main window")
         window = MainWindow()
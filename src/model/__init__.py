@@ -9,3 +9,4 @@ __init__.py for model package
 from .oct_file_reader import OCTFileReader
 from .file_manager import FileManager
 from .image_processor import ImageProcessor
+from .frame_buffer_pool import FrameBufferPool
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Normalization Kernels
+--------------------
+Numeric kernels for min-max normalizing OCT slices to uint8.
+Numba is optional: without it NUMBA_AVAILABLE is False, to_uint8_u16 is None
+and minmax falls back to NumPy reductions.
+"""
+
+from typing import Tuple
+import numpy as np
+
+try:
+    import numba
+    from numba import prange
+except ImportError:  # Numba is optional
+    numba = None
+
+NUMBA_AVAILABLE = numba is not None
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True, fastmath=True)
+    def _minmax_flat(flat):
+        vmin = flat[0]
+        vmax = flat[0]
+        for i in range(1, flat.size):
+            value = flat[i]
+            if value < vmin:
+                vmin = value
+            elif value > vmax:
+                vmax = value
+        return vmin, vmax
+
+    # Explicit signature: compiled at import time (or loaded from the cache)
+    # instead of on the first slice
+    @numba.njit('void(uint16[:, ::1], uint8[:, ::1])', parallel=True, fastmath=True, cache=True)
+    def to_uint8_u16(src, out):
+        """Min-max normalize a non-empty 2D uint16 slice into a uint8 buffer of the same shape."""
+        rows, cols = src.shape
+
+        # Per-row min/max in parallel, then a short serial reduction
+        row_min = np.empty(rows, dtype=np.uint16)
+        row_max = np.empty(rows, dtype=np.uint16)
+        for i in prange(rows):
+            lo = src[i, 0]
+            hi = src[i, 0]
+            for j in range(1, cols):
+                value = src[i, j]
+                if value < lo:
+                    lo = value
+                if value > hi:
+                    hi = value
+            row_min[i] = lo
+            row_max[i] = hi
+        vmin = np.float32(row_min.min())
+        vmax = np.float32(row_max.max())
+
+        scale = np.float32(255.0) / (vmax - vmin + np.float32(1e-10))
+        for i in prange(rows):
+            for j in range(cols):
+                out[i, j] = np.uint8((np.float32(src[i, j]) - vmin) * scale)
+else:
+    to_uint8_u16 = None
+
+
+def minmax(array: np.ndarray) -> Tuple[float, float]:
+    """
+    Compute the minimum and maximum of an array.
+
+    Uses a single fused pass when Numba is installed, otherwise two NumPy reductions.
+
+    Args:
+        array: Non-empty numeric array
+
+    Returns:
+        Tuple[float, float]: (Minimum, Maximum)
+    """
+    if NUMBA_AVAILABLE:
+        vmin, vmax = _minmax_flat(array.ravel())
+    else:
+        vmin, vmax = array.min(), array.max()
+    return float(vmin), float(vmax)
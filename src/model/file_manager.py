@@ -25,6 +25,9 @@ class FileManager:
         self.temp_dir = os.path.join(self.base_dir, "temp")
         self.export_dir = ""
         
+        # Directories already ensured by save_image
+        self._created_dirs = set()
+        
         # Create temp directory if it doesn't exist
         os.makedirs(self.temp_dir, exist_ok=True)
     
@@ -123,7 +126,8 @@ class FileManager:
         return temp_file
     
     def save_image(self, image_data: Any, file_path: str, file_format: str = "PNG", 
-                 on_duplicate: str = 'overwrite') -> Tuple[bool, str, str]:
+                 on_duplicate: str = 'overwrite',
+                 pil_kwargs: Optional[Dict[str, Any]] = None) -> Tuple[bool, str, str]:
         """
         Save image data to a file with duplicate handling.
         
@@ -135,6 +139,8 @@ class FileManager:
                         'overwrite' - Overwrite existing file
                         'skip' - Skip saving this file
                         'unique' - Create a unique filename by appending a number
+            pil_kwargs: Extra encoder options passed to PIL's Image.save
+                        (e.g. {'compress_level': 1} for PNG)
             
         Returns:
             Tuple[bool, str, str]: 
@@ -149,14 +155,23 @@ class FileManager:
             
             # Convert to PIL Image if numpy array
             if isinstance(image_data, np.ndarray):
-                image = Image.fromarray(image_data)
+                if image_data.ndim == 2 and image_data.dtype == np.uint8:
+                    # Wrap the grayscale buffer directly instead of letting
+                    # fromarray() copy non-standard strides
+                    array = np.ascontiguousarray(image_data)
+                    image = Image.frombuffer("L", array.shape[::-1], array, "raw", "L", 0, 1)
+                else:
+                    image = Image.fromarray(image_data)
             elif isinstance(image_data, Image.Image):
                 image = image_data
             else:
                 return False, "Unsupported image data type"
             
             # Ensure directory exists
-            os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+            directory = os.path.dirname(os.path.abspath(file_path))
+            if directory not in self._created_dirs:
+                os.makedirs(directory, exist_ok=True)
+                self._created_dirs.add(directory)
             
             final_path = file_path
             
@@ -185,8 +200,27 @@ class FileManager:
                 logger.info(f"No duplicate detected, saving normally")
                 msg = f"Image saved to: {file_path}"
             
-            # Save image
-            image.save(final_path, format=file_format)
+            # Save image through an unbuffered file object: PIL hands the encoder
+            # output over in large blocks, so a second userspace buffer only adds a copy
+            flags = os.O_RDWR | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+            try:
+                fd = os.open(final_path, flags, 0o666)
+            except FileNotFoundError:
+                # The directory was removed or renamed after it was cached; recreate it once
+                self._created_dirs.discard(directory)
+                os.makedirs(directory, exist_ok=True)
+                self._created_dirs.add(directory)
+                fd = os.open(final_path, flags, 0o666)
+            try:
+                with os.fdopen(fd, 'w+b', buffering=0) as f:
+                    image.save(f, format=file_format, **(pil_kwargs or {}))
+            except Exception:
+                # Don't leave a truncated image behind
+                try:
+                    os.remove(final_path)
+                except OSError:
+                    pass
+                raise
             return True, msg, final_path
         
         except Exception as e:
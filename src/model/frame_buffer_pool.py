@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Frame Buffer Pool Module
+-----------------------
+Reusable NumPy buffers for per-frame scratch arrays during export.
+"""
+
+import threading
+import numpy as np
+from typing import Tuple, Dict, List, Any
+
+
+class FrameBufferPool:
+    """Thread-safe pool of NumPy arrays keyed by (shape, dtype)."""
+
+    def __init__(self, max_per_key: int = 4):
+        """
+        Initialize the buffer pool.
+
+        Args:
+            max_per_key: Maximum number of idle buffers kept per (shape, dtype)
+        """
+        self.max_per_key = max_per_key
+        self._free: Dict[Tuple[Tuple[int, ...], np.dtype], List[np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, shape: Tuple[int, ...], dtype: Any) -> np.ndarray:
+        """
+        Get a buffer of the given shape and dtype.
+
+        The contents are undefined; callers are expected to overwrite the
+        whole buffer.
+
+        Args:
+            shape: Array shape
+            dtype: Array dtype
+
+        Returns:
+            np.ndarray: A C-contiguous buffer owned by the caller until released
+        """
+        key = (tuple(shape), np.dtype(dtype))
+        with self._lock:
+            free = self._free.get(key)
+            if free:
+                return free.pop()
+        return np.empty(key[0], dtype=key[1])
+
+    def release(self, array: np.ndarray):
+        """
+        Return a buffer obtained from acquire to the pool.
+
+        Args:
+            array: Buffer to return; it must not be used afterwards
+        """
+        key = (array.shape, array.dtype)
+        with self._lock:
+            free = self._free.setdefault(key, [])
+            if len(free) < self.max_per_key:
+                free.append(array)
+
+    def clear(self):
+        """Drop all idle buffers."""
+        with self._lock:
+            self._free.clear()
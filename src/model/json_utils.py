@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+JSON Utilities
+-------------
+Indented JSON serialization shared by the settings dialog and the validation
+script. orjson is optional: without it the standard json module is used.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the standard json module is used without it
+    orjson = None
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    Serialize to indented JSON bytes, with orjson when available.
+    
+    Args:
+        obj: JSON-serializable object
+    
+    Returns:
+        bytes: UTF-8 encoded JSON indented by two spaces
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def json_loads(data: bytes) -> Any:
+    """
+    Parse JSON bytes, with orjson when available.
+    
+    Args:
+        data: UTF-8 encoded JSON
+    
+    Returns:
+        Any: Parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -13,39 +13,268 @@ import json
 import tempfile
 import shutil
 import logging
-from typing import Tuple, List, Dict, Any, Optional, Union
+import re
+import threading
+import time
+import importlib.util
+from importlib import metadata as importlib_metadata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Sequence
+from typing import Tuple, List, Dict, Any, Optional, Union, Callable
 import numpy as np
 from PIL import Image
 import io
 
+try:
+    import cv2
+except ImportError:  # OpenCV is optional; normalization falls back to NumPy
+    cv2 = None
+
+from ._normalize_kernels import minmax, to_uint8_u16
+
 logger = logging.getLogger(__name__)
 
-# Import OCT-Converter library
-try:
-    import pkg_resources
-    from oct_converter.readers import E2E, IMG, FDS, FDA, BOCT, POCT
-    from oct_converter.readers import BOCT as OCT  # Alias BOCT as OCT for backward compatibility
-    from oct_converter.readers import POCT as OCTRAW  # Alias POCT as OCTRAW for backward compatibility
-    from oct_converter.dicom import create_dicom_from_oct
-    
-    # Check OCT-Converter version
-    required_version = "0.4.0"
-    current_version = pkg_resources.get_distribution("oct-converter").version
-    if pkg_resources.parse_version(current_version) < pkg_resources.parse_version(required_version):
-        logger.warning(f"OCT-Converter version {current_version} may be outdated. Version {required_version} or higher is recommended.")
-    
-    logger.info(f"OCT-Converter version {current_version} loaded successfully")
-    
-except ImportError as e:
-    error_msg = "OCT-Converter library not found. Please install it using: pip install oct-converter"
-    logger.error(error_msg)
-    raise ImportError(error_msg) from e
+# Check the OCT-Converter library is installed; reader classes are imported lazily
+# in load_file since importing oct_converter pulls in its whole dependency tree.
+# The version check runs once per process, from the first OCTFileReader().
+_OCT_CONVERTER_MISSING_MSG = "OCT-Converter library not found. Please install it using: pip install oct-converter"
+_OCT_CONVERTER_REQUIRED_VERSION = "0.4.0"
+
+if importlib.util.find_spec("oct_converter") is None:
+    logger.error(_OCT_CONVERTER_MISSING_MSG)
+    raise ImportError(_OCT_CONVERTER_MISSING_MSG)
+
+
+def _version_tuple(version: str) -> Tuple[int, ...]:
+    """Parse the leading numeric components of a version string, e.g. '0.5.1rc1' -> (0, 5, 1)."""
+    parts = []
+    for part in version.split('.'):
+        digits = ''
+        for char in part:
+            if not char.isdigit():
+                break
+            digits += char
+        if not digits:
+            break
+        parts.append(int(digits))
+        if len(digits) != len(part):
+            break
+    return tuple(parts)
+
+
+# uint16 slices at least this large are normalized through a 65536-entry
+# lookup table when no compiled kernel applies; building the table costs about
+# as much as normalizing this many pixels arithmetically
+_UINT16_LUT_MIN_PIXELS = 1 << 16
+
+# Input dtypes cv2.normalize accepts
+_CV2_NORMALIZE_DTYPES = frozenset(np.dtype(t) for t in (
+    np.uint8, np.int8, np.uint16, np.int16, np.int32, np.float32, np.float64
+))
+
+
+def _to_uint8(slice_data: np.ndarray) -> np.ndarray:
+    """
+    Min-max normalize image data to the 0-255 uint8 range.
+    
+    2D slices go straight to cv2.normalize when OpenCV is installed, and 2D
+    uint16 slices to the Numba kernel when Numba is. Otherwise large uint16
+    slices use a lookup table, and everything else is scaled in a single
+    float32 buffer instead of a temporary per arithmetic step.
+    
+    Args:
+        slice_data: Image data of any numeric dtype
+        
+    Returns:
+        np.ndarray: Normalized uint8 image
+    """
+    if cv2 is not None and slice_data.ndim == 2 and slice_data.dtype in _CV2_NORMALIZE_DTYPES and slice_data.size:
+        return cv2.normalize(slice_data, None, 0, 255, cv2.NORM_MINMAX, dtype=cv2.CV_8U)
+    
+    if to_uint8_u16 is not None and slice_data.dtype == np.uint16 and slice_data.ndim == 2 and slice_data.size:
+        out = np.empty(slice_data.shape, dtype=np.uint8)
+        to_uint8_u16(np.ascontiguousarray(slice_data), out)
+        return out
+    
+    vmin, vmax = minmax(slice_data)
+    scale = np.float32(255.0 / (vmax - vmin + 1e-10))
+    
+    if slice_data.dtype == np.uint16 and slice_data.size >= _UINT16_LUT_MIN_PIXELS:
+        lut = np.arange(65536, dtype=np.float32)
+        lut -= vmin
+        lut *= scale
+        np.clip(lut, 0, 255, out=lut)
+        return lut.astype(np.uint8)[slice_data]
+    
+    out = np.empty(slice_data.shape, dtype=np.float32)
+    np.subtract(slice_data, vmin, out=out, dtype=np.float32)
+    out *= scale
+    return out.astype(np.uint8, copy=False)
+
+
+# Frame IDs handed out by get_frames: vol{v}_slice{s}, fundus{i}, slice{s}
+_FRAME_RE = re.compile(r'^(?:vol(?P<vol>\d+)_slice(?P<sl>\d+)|fundus(?P<fund>\d+)|slice(?P<isl>\d+))$')
+
+# Frame kind codes stored in the 'type' field of _FRAME_DTYPE
+_FRAME_VOLUME_SLICE = 0  # vol{volume_id}_slice{slice_id} (multi-volume files)
+_FRAME_SLICE = 1         # slice{slice_id} (single-volume files)
+_FRAME_FUNDUS = 2        # fundus{volume_id}
+_FRAME_DICOM = 3         # dicom{volume_id}
+
+_FRAME_TYPE_NAMES = ('oct', 'oct', 'fundus', 'dicom')
+
+# Compact per-frame record; 'volume_id' doubles as the image index for fundus
+# and DICOM frames, 'laterality' indexes into Frames.lateralities
+_FRAME_DTYPE = np.dtype([
+    ('volume_id', 'i2'),
+    ('slice_id', 'i2'),
+    ('type', 'u1'),
+    ('laterality', 'u1'),
+])
+
+_NO_OBJ_ID = object()  # Marks blocks whose frames carry no reader object id
+
+
+class Frames(Sequence):
+    """
+    Read-only list of frame descriptors backed by a NumPy structured array.
+    
+    Frames are stored as fixed-size records instead of one dict per slice;
+    indexing materializes the same dictionaries get_frames used to return.
+    """
+    
+    __slots__ = ('file_name', 'file_path', 'records', 'lateralities', '_obj_ids')
+    
+    def __init__(self, file_name: str, file_path: str, blocks: List[Tuple[int, int, int, Any, Any]]):
+        """
+        Build the frame records from contiguous blocks of frames.
+        
+        Args:
+            file_name: Name of the loaded file
+            file_path: Full path of the loaded file
+            blocks: (kind, volume_id, count, laterality, obj_id) tuples; each
+                block expands to `count` frames with slice ids 0..count-1
+        """
+        self.file_name = file_name
+        self.file_path = file_path
+        self.lateralities = []
+        self._obj_ids = {}
+        
+        self.records = np.empty(sum(block[2] for block in blocks), dtype=_FRAME_DTYPE)
+        start = 0
+        for kind, volume_id, count, laterality, obj_id in blocks:
+            stop = start + count
+            rows = self.records[start:stop]
+            rows['volume_id'] = volume_id
+            rows['slice_id'] = np.arange(count)
+            rows['type'] = kind
+            rows['laterality'] = self._laterality_index(laterality)
+            if obj_id is not _NO_OBJ_ID:
+                self._obj_ids[(kind, volume_id)] = obj_id
+            start = stop
+    
+    def _laterality_index(self, laterality: Any) -> int:
+        """Return the index of a laterality value, adding it to the table if new."""
+        try:
+            return self.lateralities.index(laterality)
+        except ValueError:
+            self.lateralities.append(laterality)
+            return len(self.lateralities) - 1
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._materialize(row) for row in self.records[index]]
+        return self._materialize(self.records[index])
+    
+    def __iter__(self):
+        for row in self.records:
+            yield self._materialize(row)
+    
+    def _materialize(self, row) -> Dict[str, Any]:
+        """Expand a single record into a frame information dictionary."""
+        kind = int(row['type'])
+        volume_id = int(row['volume_id'])
+        slice_id = int(row['slice_id'])
+        
+        if kind == _FRAME_VOLUME_SLICE:
+            frame_id = f"vol{volume_id}_slice{slice_id}"
+        elif kind == _FRAME_SLICE:
+            frame_id = f"slice{slice_id}"
+        elif kind == _FRAME_FUNDUS:
+            frame_id = f"fundus{volume_id}"
+        else:
+            frame_id = f"dicom{volume_id}"
+        
+        frame = {
+            'id': frame_id,
+            'file_name': self.file_name,
+            'file_path': self.file_path,
+            'type': _FRAME_TYPE_NAMES[kind],
+        }
+        if kind == _FRAME_VOLUME_SLICE:
+            frame['volume_id'] = volume_id
+            frame['slice_id'] = slice_id
+            frame['volume_obj_id'] = self._obj_ids.get((kind, volume_id))
+        elif kind == _FRAME_SLICE:
+            frame['slice_id'] = slice_id
+        else:
+            frame['image_id'] = volume_id
+            if (kind, volume_id) in self._obj_ids:
+                frame['image_obj_id'] = self._obj_ids[(kind, volume_id)]
+        frame['laterality'] = self.lateralities[row['laterality']]
+        return frame
+
 
 class OCTFileReader:
     """Class for reading and parsing OCT files."""
     
+    __slots__ = (
+        'loaded_files', 'file_paths', 'file_metadata', 'supported_extensions',
+        'temp_files', 'temp_dir',
+        '_next_id', '_path_to_id', '_name_to_id', '_id_to_obj', '_file_types',
+        '_decoded_cache', '_decode_lock', '_decode_key_locks', '_frames_cache',
+        '_slice_cache', '_slice_lock', '_prefetch_pool', '_image_handlers',
+    )
+    
+    _DECODED_CACHE_SIZE = 4  # Decoded volume/fundus entries kept in the LRU cache
+    _DICOM_MANIFEST_NAME = '.export.json'  # Per-directory record of completed DICOM exports
+    _SLICE_CACHE_SIZE = 64  # Normalized OCT slices kept for repeated and neighboring frame requests
+    _PREFETCH_RADIUS = 2  # Neighboring slices decoded ahead on each side of a requested slice
+    
+    _version_checked = False
+    _version_lock = threading.Lock()
+    
+    @classmethod
+    def _check_version(cls):
+        """
+        Warn if the installed OCT-Converter is older than the required version.
+        
+        Raises:
+            ImportError: If the oct-converter distribution is not installed
+        """
+        try:
+            current_version = importlib_metadata.version("oct-converter")
+        except importlib_metadata.PackageNotFoundError as e:
+            logger.error(_OCT_CONVERTER_MISSING_MSG)
+            raise ImportError(_OCT_CONVERTER_MISSING_MSG) from e
+        
+        if _version_tuple(current_version) < _version_tuple(_OCT_CONVERTER_REQUIRED_VERSION):
+            logger.warning(f"OCT-Converter version {current_version} may be outdated. Version {_OCT_CONVERTER_REQUIRED_VERSION} or higher is recommended.")
+        
+        logger.info(f"OCT-Converter version {current_version} loaded successfully")
+    
     def __init__(self):
         """Initialize the OCT file reader."""
+        if not OCTFileReader._version_checked:
+            with OCTFileReader._version_lock:
+                if not OCTFileReader._version_checked:
+                    type(self)._check_version()
+                    OCTFileReader._version_checked = True
+        
         self.loaded_files = {}  # Dictionary to store loaded file objects by full path
         self.file_paths = {}    # Dictionary to map file names to full paths
         self.file_metadata = {}  # Dictionary to store file metadata by file name
@@ -59,13 +288,37 @@ class OCTFileReader:
         ]
         self.temp_files = []  # Track temporary files for cleanup
         
+        # Internal integer ids assigned at load time; hot-path lookups go
+        # file name -> id -> object instead of hashing long absolute paths
+        self._next_id = 0
+        self._path_to_id = {}
+        self._name_to_id = {}
+        self._id_to_obj = {}
+        self._decoded_cache = OrderedDict()  # Decoded volumes/fundus images, keyed by (file id, 'oct'|'fundus')
+        self._decode_lock = threading.Lock()  # Guards _decoded_cache and _decode_key_locks
+        self._decode_key_locks = {}  # Per-key locks so concurrent misses decode only once
+        self._frames_cache = {}  # Frames views, keyed by file id
+        self._file_types = {}  # File type tags ('e2e', 'img', ...), keyed by file id
+        self._image_handlers = {}  # Frame image getters chosen at load time, keyed by file id
+        
+        # Normalized slices keyed by (file id, volume index, slice index); filled by
+        # get_frame_image and by a background thread prefetching neighboring slices
+        self._slice_cache = OrderedDict()
+        self._slice_lock = threading.Lock()
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="oct_prefetch")
+        
         # Create a dedicated temp directory for this instance
         self.temp_dir = tempfile.mkdtemp(prefix="oct_extractor_")
         logger.debug(f"Created temporary directory: {self.temp_dir}")
         
     def __del__(self):
         """Clean up resources when the object is garbage collected."""
-        self.cleanup_temp_files()
+        # __init__ may have raised before these were set
+        pool = getattr(self, '_prefetch_pool', None)
+        if pool is not None:
+            pool.shutdown(wait=False)
+        if getattr(self, 'temp_files', None) is not None:
+            self.cleanup_temp_files()
     
     def cleanup_temp_files(self):
         """Clean up all temporary files and directories."""
@@ -104,6 +357,249 @@ class OCTFileReader:
         self.temp_files.append(temp_path)
         return temp_path
     
+    def _resolve(self, file_name: str) -> Optional[Tuple[int, str, Any]]:
+        """
+        Resolve a loaded file name to its internal id, path and reader object.
+        
+        Args:
+            file_name: Name of the loaded file
+            
+        Returns:
+            Optional[Tuple[int, str, Any]]: (File id, File path, File object), or None if not loaded
+        """
+        file_id = self._name_to_id.get(file_name)
+        if file_id is None:
+            return None
+        return file_id, self.file_paths[file_name], self._id_to_obj[file_id]
+    
+    def get_file_id(self, file_name: str) -> Optional[int]:
+        """
+        Get the internal id of a loaded file.
+        
+        Ids are never reused, so a changed id means the file was re-imported.
+        
+        Args:
+            file_name: Name of the loaded file
+            
+        Returns:
+            Optional[int]: File id, or None if the file is not loaded
+        """
+        return self._name_to_id.get(file_name)
+    
+    def _read_cached(self, file_id: int, kind: str, read: Callable[[], Any]) -> Any:
+        """
+        Return decoded file content from the LRU cache, decoding it on a miss.
+        
+        Safe to call from several threads: concurrent misses on the same key
+        wait for a single decode instead of each decoding the file.
+        
+        Args:
+            file_id: Internal id of the loaded file
+            kind: 'oct' for OCT volumes, 'fundus' for fundus images
+            read: Reader method that decodes the content
+            
+        Returns:
+            Any: Result of read()
+        """
+        key = (file_id, kind)
+        with self._decode_lock:
+            if key in self._decoded_cache:
+                self._decoded_cache.move_to_end(key)
+                return self._decoded_cache[key]
+            key_lock = self._decode_key_locks.setdefault(key, threading.Lock())
+        
+        with key_lock:
+            # Another thread may have decoded it while we waited
+            with self._decode_lock:
+                if key in self._decoded_cache:
+                    self._decoded_cache.move_to_end(key)
+                    return self._decoded_cache[key]
+            
+            try:
+                decoded = read()
+                with self._decode_lock:
+                    self._decoded_cache[key] = decoded
+                    while len(self._decoded_cache) > self._DECODED_CACHE_SIZE:
+                        self._decoded_cache.popitem(last=False)
+            finally:
+                with self._decode_lock:
+                    self._decode_key_locks.pop(key, None)
+            return decoded
+    
+    def _get_oct_volumes(self, file_id: int, file_obj: Any) -> Any:
+        """Return the cached result of file_obj.read_oct_volume(), with list volumes stacked."""
+        return self._read_cached(file_id, 'oct', lambda: self._stack_list_volumes(file_obj.read_oct_volume()))
+    
+    @staticmethod
+    def _stack_list_volumes(decoded: Any) -> Any:
+        """
+        Replace list-of-slices volumes with one contiguous ndarray, in place.
+        
+        Args:
+            decoded: Result of read_oct_volume() (a volume object or a list of them)
+            
+        Returns:
+            Any: The same decoded object
+        """
+        volumes = decoded if isinstance(decoded, (list, tuple)) else [decoded]
+        for volume in volumes:
+            data = getattr(volume, 'volume', None)
+            if not isinstance(data, list) or not data:
+                continue
+            
+            # Only stack slices that all match the first one exactly; assigning
+            # would otherwise broadcast smaller slices or cast other dtypes
+            first = np.asarray(data[0])
+            stacked = np.empty((len(data),) + first.shape, dtype=first.dtype)
+            for i, slice_data in enumerate(data):
+                slice_array = np.asarray(slice_data)
+                if slice_array.shape != first.shape or slice_array.dtype != first.dtype:
+                    logger.debug("Keeping list volume with mismatched slices: slice %s is %s %s, "
+                                 "slice 0 is %s %s", i, slice_array.shape, slice_array.dtype,
+                                 first.shape, first.dtype)
+                    break
+                stacked[i] = slice_array
+            else:
+                try:
+                    volume.volume = stacked
+                except AttributeError:
+                    pass  # Read-only volume object; slices are read from the list instead
+        return decoded
+    
+    def _get_fundus_images(self, file_id: int, file_obj: Any) -> Any:
+        """Return the cached result of file_obj.read_fundus_image()."""
+        return self._read_cached(file_id, 'fundus', file_obj.read_fundus_image)
+    
+    def _drop_cached(self, file_id: int):
+        """Drop every cached entry belonging to a file id."""
+        with self._decode_lock:
+            self._decoded_cache.pop((file_id, 'oct'), None)
+            self._decoded_cache.pop((file_id, 'fundus'), None)
+        self._frames_cache.pop(file_id, None)
+        with self._slice_lock:
+            for key in [key for key in self._slice_cache if key[0] == file_id]:
+                del self._slice_cache[key]
+    
+    def _get_cached_slice(self, key: Tuple[int, int, int]) -> Optional[np.ndarray]:
+        """
+        Look up a normalized slice in the slice cache.
+        
+        Args:
+            key: (File id, Volume index, Slice index)
+            
+        Returns:
+            Optional[np.ndarray]: Cached read-only uint8 slice, or None on a miss
+        """
+        with self._slice_lock:
+            image = self._slice_cache.get(key)
+            if image is not None:
+                self._slice_cache.move_to_end(key)
+            return image
+    
+    def _store_slice(self, key: Tuple[int, int, int], image: np.ndarray) -> np.ndarray:
+        """
+        Add a normalized slice to the slice cache, evicting the least recently used.
+        
+        Views are copied first so a cached slice never keeps its whole decoded
+        volume alive, and the cached array is marked read-only since it is
+        shared; get_frame_image hands callers their own copy. Slices of a file
+        closed in the meantime (late prefetches) are not stored.
+        
+        Args:
+            key: (File id, Volume index, Slice index)
+            image: uint8 slice
+            
+        Returns:
+            np.ndarray: The read-only array as cached
+        """
+        if image.base is not None:
+            image = np.array(image, order='C')
+        image.flags.writeable = False
+        with self._slice_lock:
+            # close_file removes the id before dropping its slices under this
+            # lock, so checking here cannot race with the drop
+            if key[0] not in self._id_to_obj:
+                return image
+            self._slice_cache[key] = image
+            self._slice_cache.move_to_end(key)
+            while len(self._slice_cache) > self._SLICE_CACHE_SIZE:
+                self._slice_cache.popitem(last=False)
+        return image
+    
+    @staticmethod
+    def _slice_image(slice_data: Any) -> np.ndarray:
+        """
+        Convert raw slice data to a displayable uint8 array.
+        
+        Args:
+            slice_data: Slice as numpy array or array-like
+            
+        Returns:
+            np.ndarray: uint8 slice (a view of the input if it already is uint8)
+        """
+        slice_data = np.asarray(slice_data)
+        if slice_data.dtype != np.uint8:
+            return _to_uint8(slice_data)
+        return slice_data
+    
+    def _prefetch_slices(self, file_id: int, volume_id: int, volume_data: Any, slice_id: int):
+        """
+        Normalize the neighbors of a slice on the prefetch thread.
+        
+        Args:
+            file_id: Internal id of the loaded file
+            volume_id: Index of the volume within the file
+            volume_data: Slices of the volume (numpy array or list)
+            slice_id: Index of the slice that was just requested
+        """
+        slice_count = len(volume_data)
+        neighbors = []
+        for offset in range(1, self._PREFETCH_RADIUS + 1):
+            neighbors.extend(j for j in (slice_id + offset, slice_id - offset) if 0 <= j < slice_count)
+        
+        def prefetch():
+            for j in neighbors:
+                if file_id not in self._id_to_obj:
+                    return  # File was closed while this prefetch was queued
+                key = (file_id, volume_id, j)
+                if self._get_cached_slice(key) is not None:
+                    continue
+                try:
+                    self._store_slice(key, self._slice_image(volume_data[j]))
+                except Exception as e:
+                    logger.debug("Prefetch of slice %s in volume %s failed: %s", j, volume_id, e)
+        
+        try:
+            self._prefetch_pool.submit(prefetch)
+        except RuntimeError:
+            pass  # Pool already shut down
+    
+    def close_file(self, file_name: str) -> bool:
+        """
+        Forget a loaded file and release its reader object.
+        
+        Args:
+            file_name: Name of the loaded file
+            
+        Returns:
+            bool: True if the file was loaded, False otherwise
+        """
+        file_path = self.file_paths.pop(file_name, None)
+        if file_path is None:
+            return False
+        
+        file_id = self._name_to_id.pop(file_name, None)
+        if self._path_to_id.get(file_path) == file_id:
+            del self._path_to_id[file_path]
+        self._id_to_obj.pop(file_id, None)
+        self._file_types.pop(file_id, None)
+        self._image_handlers.pop(file_id, None)
+        self._drop_cached(file_id)
+        self.loaded_files.pop(file_path, None)
+        self.file_metadata.pop(file_name, None)
+        logger.debug(f"Closed file {file_name}")
+        return True
+    
     def is_supported_file(self, file_path: str) -> bool:
         """
         Check if the file is supported.
@@ -156,12 +652,14 @@ class OCTFileReader:
             raise ValueError(f"Unsupported file extension: {ext}")
         
     
-    def load_file(self, file_path: str) -> Tuple[bool, str]:
+    def load_file(self, file_path: str, file_type: Optional[str] = None) -> Tuple[bool, str]:
         """
         Load an OCT file.
         
         Args:
             file_path: Path to the file
+            file_type: Already-detected file type; skips the existence probe and
+                extension checks when given
             
         Returns:
             Tuple[bool, str]: (Success, Message)
@@ -171,16 +669,22 @@ class OCTFileReader:
             from pathlib import Path
             file_path_obj = Path(file_path)
             file_path = str(file_path_obj.absolute())
-            
-            if not file_path_obj.exists():
-                logger.error(f"File not found: {file_path}")
-                return False, f"File not found: {file_path}"
-            
-            if not self.is_supported_file(file_path):
-                logger.error(f"Unsupported file type: {file_path}")
-                return False, f"Unsupported file type: {file_path}"
-            
-            file_type = self.get_file_type(file_path)
+
+            if file_type is None:
+                # Probe with a single open() instead of exists() + open(): on network
+                # filesystems every stat is a round trip
+                try:
+                    fd = os.open(file_path, os.O_RDONLY)
+                except FileNotFoundError:
+                    logger.error(f"File not found: {file_path}")
+                    return False, f"File not found: {file_path}"
+                os.close(fd)
+                
+                if not self.is_supported_file(file_path):
+                    logger.error(f"Unsupported file type: {file_path}")
+                    return False, f"Unsupported file type: {file_path}"
+                
+                file_type = self.get_file_type(file_path)
             file_name = file_path_obj.name
             
             logger.info(f"Loading OCT file: {file_name} ({file_type}) from {file_path}")
@@ -192,21 +696,27 @@ class OCTFileReader:
             try:
                 if file_type == 'e2e':
                     # Using filepath directly as E2E class expects
+                    from oct_converter.readers import E2E
                     self.loaded_files[file_path] = E2E(file_path)
                     logger.info(f"Successfully loaded E2E file {file_name}")
                 elif file_type == 'img':
+                    from oct_converter.readers import IMG
                     self.loaded_files[file_path] = IMG(file_path)
                     logger.info(f"Successfully loaded IMG file {file_name}")
                 elif file_type == 'fds':
+                    from oct_converter.readers import FDS
                     self.loaded_files[file_path] = FDS(file_path)
                     logger.info(f"Successfully loaded FDS file {file_name}")
                 elif file_type == 'fda':
+                    from oct_converter.readers import FDA
                     self.loaded_files[file_path] = FDA(file_path)
                     logger.info(f"Successfully loaded FDA file {file_name}")
                 elif file_type == 'oct':
+                    from oct_converter.readers import BOCT as OCT  # Alias BOCT as OCT for backward compatibility
                     self.loaded_files[file_path] = OCT(file_path)
                     logger.info(f"Successfully loaded OCT file {file_name}")
                 elif file_type == 'octraw':
+                    from oct_converter.readers import POCT as OCTRAW  # Alias POCT as OCTRAW for backward compatibility
                     self.loaded_files[file_path] = OCTRAW(file_path)
                     logger.info(f"Successfully loaded OCTRAW file {file_name}")
                 elif file_type == 'dcm':
@@ -218,6 +728,23 @@ class OCTFileReader:
                 logger.error(f"Error loading OCT file {file_path}: {e}", exc_info=True)
                 return False, f"Error loading OCT file: {str(e)}"
             
+            # Assign an internal id, dropping the entry of a previous load of the same path
+            old_id = self._path_to_id.get(file_path)
+            if old_id is not None:
+                self._id_to_obj.pop(old_id, None)
+                self._file_types.pop(old_id, None)
+                self._image_handlers.pop(old_id, None)
+                self._drop_cached(old_id)
+            file_id = self._next_id
+            self._next_id += 1
+            self._path_to_id[file_path] = file_id
+            self._name_to_id[file_name] = file_id
+            self._id_to_obj[file_id] = self.loaded_files[file_path]
+            self._file_types[file_id] = file_type
+            handler = self._IMAGE_HANDLERS.get(file_type)
+            if handler is not None:
+                self._image_handlers[file_id] = handler
+            
             # Extract and store metadata
             try:
                 # Most OCT-Converter readers have read_all_metadata method
@@ -258,6 +785,43 @@ class OCTFileReader:
             logger.error(f"Unhandled error loading file {file_path}: {e}", exc_info=True)
             return False, f"Error loading file: {str(e)}"
     
+    def _metadata_e2e(self, file_name: str, file_id: int, file_path: str, file_obj: Any) -> Dict[str, Any]:
+        """Extract metadata from a Heidelberg E2E file."""
+        logger.debug(f"Extracting metadata for E2E file: {file_name}")
+        metadata = file_obj.read_all_metadata()
+        # Add basic file information
+        metadata.update({
+            "file_type": "Heidelberg OCT E2E",
+            "file_name": file_name,
+            "file_path": file_path
+        })
+        return metadata
+    
+    def _metadata_img(self, file_name: str, file_id: int, file_path: str, file_obj: Any) -> Dict[str, Any]:
+        """Extract metadata from a Zeiss IMG file."""
+        logger.debug(f"Extracting metadata for IMG file: {file_name}")
+        # For IMG files, we have limited metadata
+        metadata = {
+            "file_type": "Zeiss Cirrus OCT RAW",
+            "file_name": file_name,
+            "file_path": file_path
+        }
+        
+        # Try to extract more metadata if available
+        try:
+            oct_volume = self._get_oct_volumes(file_id, file_obj)
+            if hasattr(oct_volume, 'metadata'):
+                metadata.update(oct_volume.metadata)
+        except Exception as e:
+            logger.warning(f"Could not extract volume metadata from IMG file: {e}")
+        return metadata
+    
+    # Metadata extractors by file type tag
+    _METADATA_HANDLERS = {
+        'e2e': _metadata_e2e,
+        'img': _metadata_img,
+    }
+    
     def _extract_metadata(self, file_name: str) -> Dict[str, Any]:
         """
         Extract metadata from a loaded file.
@@ -268,53 +832,23 @@ class OCTFileReader:
         Returns:
             Dict[str, Any]: Metadata dictionary
         """
-        if file_name not in self.file_paths:
+        resolved = self._resolve(file_name)
+        if resolved is None:
             logger.error(f"File path not found for: {file_name}")
             raise ValueError(f"File not loaded: {file_name}")
         
-        file_path = self.file_paths[file_name]
-        if file_path not in self.loaded_files:
-            logger.error(f"File object not found for path: {file_path}")
-            raise ValueError(f"File not loaded correctly: {file_path}")
-        
-        file_obj = self.loaded_files[file_path]
+        file_id, file_path, file_obj = resolved
+        handler = self._METADATA_HANDLERS.get(self._file_types[file_id])
         
         try:
-            # Extract metadata based on file type
-            if isinstance(file_obj, E2E):
-                logger.debug(f"Extracting metadata for E2E file: {file_name}")
-                metadata = file_obj.read_all_metadata()
-                # Add basic file information
-                metadata.update({
-                    "file_type": "Heidelberg OCT E2E",
-                    "file_name": file_name,
-                    "file_path": file_path
-                })
-            elif isinstance(file_obj, IMG):
-                logger.debug(f"Extracting metadata for IMG file: {file_name}")
-                # For IMG files, we have limited metadata
-                metadata = {
-                    "file_type": "Zeiss Cirrus OCT RAW",
-                    "file_name": file_name,
-                    "file_path": file_path
-                }
-                
-                # Try to extract more metadata if available
-                try:
-                    oct_volume = file_obj.read_oct_volume()
-                    if hasattr(oct_volume, 'metadata'):
-                        metadata.update(oct_volume.metadata)
-                except Exception as e:
-                    logger.warning(f"Could not extract volume metadata from IMG file: {e}")
-            else:
+            if handler is None:
                 logger.warning(f"Unknown file type for metadata extraction: {type(file_obj)}")
-                metadata = {
+                return {
                     "file_type": "Unknown",
                     "file_name": file_name,
                     "file_path": file_path
                 }
-            
-            return metadata
+            return handler(self, file_name, file_id, file_path, file_obj)
         
         except Exception as e:
             logger.error(f"Error extracting metadata for {file_name}: {str(e)}", exc_info=True)
@@ -325,68 +859,111 @@ class OCTFileReader:
                 "error": str(e)
             }
     
-    def get_preview(self, file_name: str) -> Tuple[Optional[str], Optional[str]]:
+    @staticmethod
+    def _encode_png(image_data: Any) -> bytes:
         """
-        Get a preview image and metadata for a loaded file.
+        Encode image data as PNG bytes in memory.
+        
+        Args:
+            image_data: Image data as numpy array (any dtype) or PIL Image
+            
+        Returns:
+            bytes: PNG-encoded image
+        """
+        if isinstance(image_data, Image.Image):
+            image = image_data
+        else:
+            array = np.asarray(image_data)
+            if array.dtype != np.uint8:
+                # Normalize to 0-255 range
+                array = _to_uint8(array)
+            image = Image.fromarray(array)
+        
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG")
+        return buffer.getvalue()
+    
+    @staticmethod
+    def _volume_projection(oct_volume: Any) -> np.ndarray:
+        """
+        Compute the en-face mean projection of an OCT volume.
+        
+        Args:
+            oct_volume: OCT volume object with a 'volume' attribute (slices, depth, width)
+            
+        Returns:
+            np.ndarray: 2D projection image
+        """
+        return np.mean(np.asarray(oct_volume.volume), axis=1)
+    
+    def _preview_e2e(self, file_name: str, file_id: int, file_obj: Any) -> Optional[bytes]:
+        """Build preview PNG bytes for a Heidelberg E2E file."""
+        preview_bytes = None
+        
+        # For E2E files, try to get a fundus image first
+        try:
+            logger.debug(f"Attempting to read fundus image from {file_name}")
+            fundus_images = self._get_fundus_images(file_id, file_obj)
+            if fundus_images and len(fundus_images) > 0:
+                preview_bytes = self._encode_png(fundus_images[0].image)
+                logger.debug(f"Created fundus preview image for {file_name}")
+        except Exception as e:
+            logger.debug(f"Could not create fundus preview for {file_name}: {e}")
+        
+        # If no fundus image, use first OCT volume
+        if not preview_bytes:
+            try:
+                logger.debug(f"Attempting to read OCT volume from {file_name}")
+                oct_volumes = self._get_oct_volumes(file_id, file_obj)
+                if oct_volumes and len(oct_volumes) > 0:
+                    preview_bytes = self._encode_png(self._volume_projection(oct_volumes[0]))
+                    logger.debug(f"Created OCT volume projection preview for {file_name}")
+            except Exception as e:
+                logger.debug(f"Could not create OCT volume preview for {file_name}: {e}")
+        
+        return preview_bytes
+    
+    def _preview_img(self, file_name: str, file_id: int, file_obj: Any) -> Optional[bytes]:
+        """Build preview PNG bytes for a Zeiss IMG file."""
+        # For IMG files, use OCT volume
+        try:
+            logger.debug(f"Attempting to read OCT volume from IMG file {file_name}")
+            oct_volume = self._get_oct_volumes(file_id, file_obj)
+            preview_bytes = self._encode_png(self._volume_projection(oct_volume))
+            logger.debug(f"Created IMG file preview for {file_name}")
+            return preview_bytes
+        except Exception as e:
+            logger.warning(f"Could not create IMG file preview for {file_name}: {e}")
+            return None
+    
+    # Preview builders by file type tag
+    _PREVIEW_HANDLERS = {
+        'e2e': _preview_e2e,
+        'img': _preview_img,
+    }
+    
+    def get_preview_bytes(self, file_name: str) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        Get a PNG-encoded preview image and metadata for a loaded file.
         
         Args:
             file_name: Name of the loaded file
             
         Returns:
-            Tuple[Optional[str], Optional[str]]: (Preview image path, Metadata string)
+            Tuple[Optional[bytes], Optional[str]]: (Preview PNG bytes, Metadata string)
         """
-        if file_name not in self.file_paths:
+        resolved = self._resolve(file_name)
+        if resolved is None:
             logger.warning(f"Requested preview for non-loaded file: {file_name}")
             return None, None
-            
-        file_path = self.file_paths[file_name]
-        if file_path not in self.loaded_files:
-            logger.error(f"File object not found for path: {file_path}")
-            return None, None
         
-        file_obj = self.loaded_files[file_path]
-        preview_path = None
+        file_id, _, file_obj = resolved
+        handler = self._PREVIEW_HANDLERS.get(self._file_types[file_id])
         metadata_str = None
         
         try:
             # Generate preview based on file type
-            if isinstance(file_obj, E2E):
-                # For E2E files, try to get a fundus image first
-                try:
-                    logger.debug(f"Attempting to read fundus image from {file_name}")
-                    fundus_images = file_obj.read_fundus_image()
-                    if fundus_images and len(fundus_images) > 0:
-                        # Create a temporary file for the preview
-                        preview_path = self._create_temp_file(prefix=f"{file_name}_fundus_", suffix=".png")
-                        fundus_images[0].save(preview_path)
-                        logger.debug(f"Created fundus preview image for {file_name}")
-                except Exception as e:
-                    logger.debug(f"Could not create fundus preview for {file_name}: {e}")
-                
-                # If no fundus image, use first OCT volume
-                if not preview_path:
-                    try:
-                        logger.debug(f"Attempting to read OCT volume from {file_name}")
-                        oct_volumes = file_obj.read_oct_volume()
-                        if oct_volumes and len(oct_volumes) > 0:
-                            # Create a temporary file for the preview
-                            preview_path = self._create_temp_file(prefix=f"{file_name}_oct_", suffix=".png")
-                            oct_volumes[0].save_projection(preview_path)
-                            logger.debug(f"Created OCT volume projection preview for {file_name}")
-                    except Exception as e:
-                        logger.debug(f"Could not create OCT volume preview for {file_name}: {e}")
-            
-            elif isinstance(file_obj, IMG):
-                # For IMG files, use OCT volume
-                try:
-                    logger.debug(f"Attempting to read OCT volume from IMG file {file_name}")
-                    oct_volume = file_obj.read_oct_volume()
-                    # Create a temporary file for the preview
-                    preview_path = self._create_temp_file(prefix=f"{file_name}_img_", suffix=".png")
-                    oct_volume.save_projection(preview_path)
-                    logger.debug(f"Created IMG file preview for {file_name}")
-                except Exception as e:
-                    logger.warning(f"Could not create IMG file preview for {file_name}: {e}")
+            preview_bytes = handler(self, file_name, file_id, file_obj) if handler else None
             
             # Format metadata as string
             if file_name in self.file_metadata:
@@ -397,413 +974,428 @@ class OCTFileReader:
                     logger.warning(f"Failed to convert metadata to JSON for {file_name}: {e}")
                     metadata_str = f"{{\"error\": \"Failed to format metadata: {str(e)}\"}}"
             
-            if not preview_path:
+            if not preview_bytes:
                 logger.warning(f"Failed to generate any preview for {file_name}")
             
-            return preview_path, metadata_str
+            return preview_bytes, metadata_str
         
         except Exception as e:
             logger.error(f"Error generating preview for {file_name}: {str(e)}", exc_info=True)
             return None, f"Error: {str(e)}"
     
-    def get_frames(self, file_name: str) -> List[Dict[str, Any]]:
+    def get_preview(self, file_name: str) -> Tuple[Optional[str], Optional[str]]:
         """
-        Get a list of available frames in the file.
+        Get a preview image and metadata for a loaded file.
+        
+        Kept for callers that need a file path; prefer get_preview_bytes().
         
         Args:
             file_name: Name of the loaded file
             
         Returns:
-            List[Dict[str, Any]]: List of frame information dictionaries
+            Tuple[Optional[str], Optional[str]]: (Preview image path, Metadata string)
         """
-        if file_name not in self.file_paths:
-            logger.warning(f"Attempted to get frames for non-loaded file: {file_name}")
-            return []
-            
-        file_path = self.file_paths[file_name]
-        if file_path not in self.loaded_files:
-            logger.error(f"File object not found for path: {file_path}")
-            return []
+        preview_bytes, metadata_str = self.get_preview_bytes(file_name)
+        if not preview_bytes:
+            return None, metadata_str
         
-        file_obj = self.loaded_files[file_path]
-        frames = []
+        preview_path = self._create_temp_file(prefix=f"{file_name}_preview_", suffix=".png")
+        with open(preview_path, 'wb') as f:
+            f.write(preview_bytes)
+        return preview_path, metadata_str
+    
+    def _frames_e2e(self, file_name: str, file_id: int, file_obj: Any) -> List[Tuple[int, int, int, Any, Any]]:
+        """Collect frame blocks (OCT volumes and fundus images) of a Heidelberg E2E file."""
+        blocks = []
         
         try:
-            # Extract frames based on file type
-            if isinstance(file_obj, E2E):
-                try:
-                    # For E2E files, get OCT volumes directly
-                    logger.debug(f"Reading OCT volumes from {file_name}")
-                    oct_volumes = file_obj.read_oct_volume()
-                    logger.info(f"Successfully read {len(oct_volumes)} OCT volumes from {file_name}")
-                    
-                    # Process each volume
-                    for i, volume in enumerate(oct_volumes):
-                        if not hasattr(volume, 'volume') or volume.volume is None:
-                            logger.warning(f"Volume {i} has no volume data")
-                            continue
-                            
-                        # Check if volume.volume is a list or numpy array
-                        if isinstance(volume.volume, list):
-                            # Handle case where volume.volume is a list
-                            slices_count = len(volume.volume)
-                            logger.debug(f"Processing volume {i} with {slices_count} slices (list type)")
-                        else:
-                            # Assume it's a numpy array
-                            slices_count = volume.volume.shape[0]
-                            logger.debug(f"Processing volume {i} with {slices_count} slices, shape: {volume.volume.shape}")
-                        
-                        # Get volume_id and laterality from the volume if available
-                        volume_id = getattr(volume, 'volume_id', f"vol{i}")
-                        laterality = getattr(volume, 'laterality', 'Unknown')
-                        logger.debug(f"Volume {i} ID: {volume_id}, laterality: {laterality}")
+            # For E2E files, get OCT volumes directly
+            logger.debug(f"Reading OCT volumes from {file_name}")
+            oct_volumes = self._get_oct_volumes(file_id, file_obj)
+            logger.info(f"Successfully read {len(oct_volumes)} OCT volumes from {file_name}")
+            
+            # Process each volume
+            for i, volume in enumerate(oct_volumes):
+                if not hasattr(volume, 'volume') or volume.volume is None:
+                    logger.warning(f"Volume {i} has no volume data")
+                    continue
                     
-                        for j in range(slices_count):
-                            frames.append({
-                                'id': f"vol{i}_slice{j}",
-                                'file_name': file_name,
-                                'file_path': file_path,
-                                'type': 'oct',
-                                'volume_id': i,
-                                'slice_id': j,
-                                'volume_obj_id': volume_id,
-                                'laterality': laterality
-                            })
-                    logger.debug(f"Extracted OCT slices from E2E file {file_name}")
-                except Exception as e:
-                    logger.error(f"Failed to extract OCT volumes from E2E file {file_name}: {e}", exc_info=True)
+                # Check if volume.volume is a list or numpy array
+                if isinstance(volume.volume, list):
+                    # Handle case where volume.volume is a list
+                    slices_count = len(volume.volume)
+                    logger.debug(f"Processing volume {i} with {slices_count} slices (list type)")
+                else:
+                    # Assume it's a numpy array
+                    slices_count = volume.volume.shape[0]
+                    logger.debug(f"Processing volume {i} with {slices_count} slices, shape: {volume.volume.shape}")
                 
-                try:
-                    # Also get fundus images from E2E files
-                    logger.debug(f"Reading fundus images from E2E file {file_name}")
-                    fundus_images = file_obj.read_fundus_image()
-                    logger.info(f"Successfully read {len(fundus_images)} fundus images from E2E file {file_name}")
-                    
-                    for i, image in enumerate(fundus_images):
-                        # Get image_id and laterality from the image if available
-                        image_id = getattr(image, 'image_id', f"fundus{i}")
-                        laterality = getattr(image, 'laterality', 'Unknown')
-                        logger.debug(f"Fundus image {i} ID: {image_id}, laterality: {laterality}")
-                        
-                        frames.append({
-                            'id': f"fundus{i}",
-                            'file_name': file_name,
-                            'file_path': file_path,
-                            'type': 'fundus',
-                            'image_id': i,
-                            'image_obj_id': image_id,
-                            'laterality': laterality
-                        })
-                    logger.debug(f"Extracted {len(fundus_images)} fundus images from E2E file {file_name}")
-                except Exception as e:
-                    logger.error(f"Failed to extract fundus images from E2E file {file_name}: {e}")
+                # Get volume_id and laterality from the volume if available
+                volume_id = getattr(volume, 'volume_id', f"vol{i}")
+                laterality = getattr(volume, 'laterality', 'Unknown')
+                logger.debug(f"Volume {i} ID: {volume_id}, laterality: {laterality}")
+                
+                blocks.append((_FRAME_VOLUME_SLICE, i, slices_count, laterality, volume_id))
+            logger.debug(f"Extracted OCT slices from E2E file {file_name}")
+        except Exception as e:
+            logger.error(f"Failed to extract OCT volumes from E2E file {file_name}: {e}", exc_info=True)
+        
+        try:
+            # Also get fundus images from E2E files
+            logger.debug(f"Reading fundus images from E2E file {file_name}")
+            fundus_images = self._get_fundus_images(file_id, file_obj)
+            logger.info(f"Successfully read {len(fundus_images)} fundus images from E2E file {file_name}")
             
-            elif isinstance(file_obj, IMG):
-                try:
-                    # For IMG files, get OCT volume directly
-                    logger.debug(f"Reading OCT volume from IMG file {file_name}")
-                    oct_volume = file_obj.read_oct_volume()
-                    
-                    if not hasattr(oct_volume, 'volume') or oct_volume.volume is None:
-                        logger.warning(f"IMG file {file_name} has no volume data")
-                        return frames
+            for i, image in enumerate(fundus_images):
+                # Get image_id and laterality from the image if available
+                image_id = getattr(image, 'image_id', f"fundus{i}")
+                laterality = getattr(image, 'laterality', 'Unknown')
+                logger.debug(f"Fundus image {i} ID: {image_id}, laterality: {laterality}")
                 
-                    # Add each slice as a separate frame
-                    slices_count = oct_volume.volume.shape[0]
-                    laterality = getattr(oct_volume, 'laterality', 'Unknown')
-                    logger.debug(f"Processing IMG volume with {slices_count} slices, shape: {oct_volume.volume.shape}, laterality: {laterality}")
-                    
-                    for j in range(slices_count):
-                        frames.append({
-                            'id': f"slice{j}",
-                            'file_name': file_name,
-                            'file_path': file_path,
-                            'type': 'oct',
-                            'slice_id': j,
-                            'laterality': laterality
-                        })
-                    logger.info(f"Extracted {slices_count} slices from IMG file {file_name}")
-                except Exception as e:
-                    logger.error(f"Failed to extract OCT volume from IMG file {file_name}: {e}", exc_info=True)
+                blocks.append((_FRAME_FUNDUS, i, 1, laterality, image_id))
+            logger.debug(f"Extracted {len(fundus_images)} fundus images from E2E file {file_name}")
+        except Exception as e:
+            logger.error(f"Failed to extract fundus images from E2E file {file_name}: {e}")
+        
+        return blocks
+    
+    def _frames_img(self, file_name: str, file_id: int, file_obj: Any) -> List[Tuple[int, int, int, Any, Any]]:
+        """Collect frame blocks (OCT slices) of a Zeiss IMG file."""
+        try:
+            # For IMG files, get OCT volume directly
+            logger.debug(f"Reading OCT volume from IMG file {file_name}")
+            oct_volume = self._get_oct_volumes(file_id, file_obj)
             
-            elif isinstance(file_obj, FDS) or isinstance(file_obj, FDA):
-                try:
-                    # For Topcon files, get OCT volume
-                    logger.debug(f"Reading OCT volume from Topcon file {file_name}")
-                    oct_volume = file_obj.read_oct_volume()
-                    
-                    if not hasattr(oct_volume, 'volume') or oct_volume.volume is None:
-                        logger.warning(f"Topcon file {file_name} has no volume data")
-                    else:
-                        # Add each slice as a separate frame
-                        slices_count = oct_volume.volume.shape[0]
-                        laterality = getattr(oct_volume, 'laterality', 'Unknown')
-                        logger.debug(f"Processing Topcon volume with {slices_count} slices, shape: {oct_volume.volume.shape}, laterality: {laterality}")
-                        
-                        for j in range(slices_count):
-                            frames.append({
-                                'id': f"slice{j}",
-                                'file_name': file_name,
-                                'file_path': file_path,
-                                'type': 'oct',
-                                'slice_id': j,
-                                'laterality': laterality
-                            })
-                        logger.info(f"Extracted {slices_count} OCT slices from Topcon file {file_name}")
-                    
-                    # Try to get fundus image
-                    try:
-                        logger.debug(f"Reading fundus image from Topcon file {file_name}")
-                        fundus_image = file_obj.read_fundus_image()
-                        if fundus_image is not None:
-                            frames.append({
-                                'id': "fundus0",
-                                'file_name': file_name,
-                                'file_path': file_path,
-                                'type': 'fundus',
-                                'image_id': 0,
-                                'laterality': getattr(fundus_image, 'laterality', 'Unknown')
-                            })
-                            logger.debug(f"Extracted fundus image from Topcon file {file_name}")
-                    except Exception as e:
-                        logger.warning(f"Failed to extract fundus image from Topcon file {file_name}: {e}")
-                except Exception as e:
-                    logger.error(f"Failed to extract OCT volume from Topcon file {file_name}: {e}", exc_info=True)
+            if not hasattr(oct_volume, 'volume') or oct_volume.volume is None:
+                logger.warning(f"IMG file {file_name} has no volume data")
+                return []
         
-            elif isinstance(file_obj, OCT) or isinstance(file_obj, OCTRAW):
-                try:
-                    # For Bioptigen/Optovue files, get OCT volume
-                    file_type_name = type(file_obj).__name__
-                    logger.debug(f"Reading OCT volume from {file_type_name} file {file_name}")
-                    oct_volume = file_obj.read_oct_volume()
-                    
-                    if not hasattr(oct_volume, 'volume') or oct_volume.volume is None:
-                        logger.warning(f"{file_type_name} file {file_name} has no volume data")
-                    else:
-                        # Add each slice as a separate frame
-                        slices_count = oct_volume.volume.shape[0]
-                        laterality = getattr(oct_volume, 'laterality', 'Unknown')
-                        logger.debug(f"Processing {file_type_name} volume with {slices_count} slices, shape: {oct_volume.volume.shape}, laterality: {laterality}")
-                        
-                        for j in range(slices_count):
-                            frames.append({
-                                'id': f"slice{j}",
-                                'file_name': file_name,
-                                'file_path': file_path,
-                                'type': 'oct',
-                                'slice_id': j,
-                                'laterality': laterality
-                            })
-                        logger.info(f"Extracted {slices_count} OCT slices from {file_type_name} file {file_name}")
-                except Exception as e:
-                    logger.error(f"Failed to extract OCT volume from {type(file_obj).__name__} file {file_name}: {e}", exc_info=True)
+            # Add each slice as a separate frame
+            slices_count = oct_volume.volume.shape[0]
+            laterality = getattr(oct_volume, 'laterality', 'Unknown')
+            logger.debug(f"Processing IMG volume with {slices_count} slices, shape: {oct_volume.volume.shape}, laterality: {laterality}")
             
-            elif isinstance(file_obj, dict) and file_obj.get('file_type') == 'dcm':
-                # Handle DICOM files - for now just create a placeholder
-                try:
-                    frames.append({
-                        'id': "dicom0",
-                        'file_name': file_name,
-                        'file_path': file_path,
-                        'type': 'dicom',
-                        'image_id': 0,
-                        'laterality': 'Unknown'
-                    })
-                    logger.debug(f"Added placeholder frame for DICOM file {file_name}")
-                except Exception as e:
-                    logger.error(f"Failed to process DICOM file {file_name}: {e}", exc_info=True)
+            logger.info(f"Extracted {slices_count} slices from IMG file {file_name}")
+            return [(_FRAME_SLICE, 0, slices_count, laterality, _NO_OBJ_ID)]
+        except Exception as e:
+            logger.error(f"Failed to extract OCT volume from IMG file {file_name}: {e}", exc_info=True)
+            return []
+    
+    def _frames_topcon(self, file_name: str, file_id: int, file_obj: Any) -> List[Tuple[int, int, int, Any, Any]]:
+        """Collect frame blocks (OCT slices and fundus image) of a Topcon FDS/FDA file."""
+        blocks = []
+        
+        try:
+            # For Topcon files, get OCT volume
+            logger.debug(f"Reading OCT volume from Topcon file {file_name}")
+            oct_volume = self._get_oct_volumes(file_id, file_obj)
+            
+            if not hasattr(oct_volume, 'volume') or oct_volume.volume is None:
+                logger.warning(f"Topcon file {file_name} has no volume data")
+            else:
+                # Add each slice as a separate frame
+                slices_count = oct_volume.volume.shape[0]
+                laterality = getattr(oct_volume, 'laterality', 'Unknown')
+                logger.debug(f"Processing Topcon volume with {slices_count} slices, shape: {oct_volume.volume.shape}, laterality: {laterality}")
+                
+                blocks.append((_FRAME_SLICE, 0, slices_count, laterality, _NO_OBJ_ID))
+                logger.info(f"Extracted {slices_count} OCT slices from Topcon file {file_name}")
+            
+            # Try to get fundus image
+            try:
+                logger.debug(f"Reading fundus image from Topcon file {file_name}")
+                fundus_image = self._get_fundus_images(file_id, file_obj)
+                if fundus_image is not None:
+                    laterality = getattr(fundus_image, 'laterality', 'Unknown')
+                    blocks.append((_FRAME_FUNDUS, 0, 1, laterality, _NO_OBJ_ID))
+                    logger.debug(f"Extracted fundus image from Topcon file {file_name}")
+            except Exception as e:
+                logger.warning(f"Failed to extract fundus image from Topcon file {file_name}: {e}")
+        except Exception as e:
+            logger.error(f"Failed to extract OCT volume from Topcon file {file_name}: {e}", exc_info=True)
+        
+        return blocks
+    
+    def _frames_bioptigen(self, file_name: str, file_id: int, file_obj: Any) -> List[Tuple[int, int, int, Any, Any]]:
+        """Collect frame blocks (OCT slices) of a Bioptigen/Optovue file."""
+        file_type_name = type(file_obj).__name__
+        
+        try:
+            # For Bioptigen/Optovue files, get OCT volume
+            logger.debug(f"Reading OCT volume from {file_type_name} file {file_name}")
+            oct_volume = self._get_oct_volumes(file_id, file_obj)
+            
+            if not hasattr(oct_volume, 'volume') or oct_volume.volume is None:
+                logger.warning(f"{file_type_name} file {file_name} has no volume data")
+                return []
+            
+            # Add each slice as a separate frame
+            slices_count = oct_volume.volume.shape[0]
+            laterality = getattr(oct_volume, 'laterality', 'Unknown')
+            logger.debug(f"Processing {file_type_name} volume with {slices_count} slices, shape: {oct_volume.volume.shape}, laterality: {laterality}")
             
+            logger.info(f"Extracted {slices_count} OCT slices from {file_type_name} file {file_name}")
+            return [(_FRAME_SLICE, 0, slices_count, laterality, _NO_OBJ_ID)]
+        except Exception as e:
+            logger.error(f"Failed to extract OCT volume from {file_type_name} file {file_name}: {e}", exc_info=True)
+            return []
+    
+    def _frames_dicom(self, file_name: str, file_id: int, file_obj: Any) -> List[Tuple[int, int, int, Any, Any]]:
+        """Collect frame blocks of a DICOM file - for now just a placeholder."""
+        logger.debug(f"Added placeholder frame for DICOM file {file_name}")
+        return [(_FRAME_DICOM, 0, 1, 'Unknown', _NO_OBJ_ID)]
+    
+    # Frame block collectors by file type tag
+    _FRAME_HANDLERS = {
+        'e2e': _frames_e2e,
+        'img': _frames_img,
+        'fds': _frames_topcon,
+        'fda': _frames_topcon,
+        'oct': _frames_bioptigen,
+        'octraw': _frames_bioptigen,
+        'dcm': _frames_dicom,
+    }
+    
+    def get_frames(self, file_name: str) -> Sequence[Dict[str, Any]]:
+        """
+        Get a list of available frames in the file.
+        
+        Args:
+            file_name: Name of the loaded file
+            
+        Returns:
+            Sequence[Dict[str, Any]]: Frames view yielding frame information dictionaries
+        """
+        resolved = self._resolve(file_name)
+        if resolved is None:
+            logger.warning(f"Attempted to get frames for non-loaded file: {file_name}")
+            return []
+        
+        file_id, file_path, file_obj = resolved
+        cached = self._frames_cache.get(file_id)
+        if cached is not None:
+            return cached
+        
+        try:
+            # Extract frames based on file type
+            handler = self._FRAME_HANDLERS.get(self._file_types[file_id])
+            blocks = handler(self, file_name, file_id, file_obj) if handler else []
+            
+            frames = Frames(file_name, file_path, blocks)
             if not frames:
                 logger.warning(f"No frames were extracted from {file_name}")
             else:
                 logger.info(f"Successfully extracted {len(frames)} total frames from {file_name}")
+                self._frames_cache[file_id] = frames
             
             return frames
         
         except Exception as e:
             logger.error(f"Error getting frames from {file_name}: {e}", exc_info=True)
             return []
-    def get_frame_image(self, file_name: str, frame_id: str) -> Optional[np.ndarray]:
+    
+    def _read_slice(self, file_name: str, file_id: int, volume_id: int, volume: Any, slice_id: int) -> Optional[np.ndarray]:
         """
-        Get the image data for a specific frame.
+        Extract one slice of an OCT volume as a uint8 image and cache it.
         
         Args:
             file_name: Name of the loaded file
-            frame_id: ID of the frame
+            file_id: Internal id of the loaded file
+            volume_id: Index of the volume within the file
+            volume: OCT volume object with a 'volume' attribute
+            slice_id: Index of the slice within the volume
             
         Returns:
-            Optional[np.ndarray]: Image data as numpy array, or None if error
+            Optional[np.ndarray]: Read-only uint8 slice, or None if unavailable
         """
-        if file_name not in self.file_paths:
-            logger.warning(f"Cannot get frame image: file '{file_name}' not loaded")
+        if not hasattr(volume, 'volume') or volume.volume is None:
+            logger.warning("Volume %s in %s has no 'volume' attribute or is None", volume_id, file_name)
             return None
-            
-        file_path = self.file_paths[file_name]
-        if file_path not in self.loaded_files:
-            logger.error(f"File object not found for path: {file_path}")
+        
+        # An ndarray, or a list of slices when _stack_list_volumes could not
+        # stack them (mismatched slices or a read-only volume object)
+        volume_data = volume.volume
+        
+        if slice_id >= len(volume_data):
+            logger.warning("Slice index %s out of bounds for volume %s in %s. "
+                           "Volume has %s slices", slice_id, volume_id, file_name, len(volume_data))
             return None
         
-        file_obj = self.loaded_files[file_path]
-        logger.debug(f"Getting frame {frame_id} from file {file_name} (path: {file_path})")
+        slice_data = np.asarray(volume_data[slice_id])
+        logger.debug("Successfully retrieved OCT slice %s from volume %s of %s. "
+                     "Slice shape: %s, dtype: %s", slice_id, volume_id, file_name, slice_data.shape, slice_data.dtype)
         
-        try:
-            # Extract frame based on file type and frame ID
-            if isinstance(file_obj, E2E):
-                if frame_id.startswith('vol'):
-                    try:
-                        # Parse the volume and slice IDs from the frame_id
-                        parts = frame_id.split('_')
-                        volume_id = int(parts[0][3:])
-                        slice_id = int(parts[1][5:])
-                        
-                        # Read all OCT volumes (following the example code)
-                        logger.debug(f"Reading OCT volumes for {file_name} to access volume {volume_id}, slice {slice_id}")
-                        oct_volumes = file_obj.read_oct_volume()
-                        
-                        if volume_id >= len(oct_volumes):
-                            logger.warning(f"Volume index {volume_id} out of bounds in {file_name}. Available volumes: {len(oct_volumes)}")
-                            return None
-                            
-                        volume = oct_volumes[volume_id]
-                        if not hasattr(volume, 'volume') or volume.volume is None:
-                            logger.warning(f"Volume {volume_id} in {file_name} has no 'volume' attribute or is None")
-                            return None
-                            
-                        # Check if volume.volume is a list or numpy array
-                        if isinstance(volume.volume, list):
-                            # Handle case where volume.volume is a list
-                            if slice_id >= len(volume.volume):
-                                logger.warning(f"Slice index {slice_id} out of bounds for volume {volume_id} in {file_name}. "
-                                               f"Volume length: {len(volume.volume)}")
-                                return None
-                                
-                            # Get the slice data from the list
-                            slice_data = volume.volume[slice_id]
-                            logger.debug(f"Successfully retrieved OCT slice {slice_id} from volume {volume_id} of {file_name} (list type).")
-                            
-                            # If the slice_data isn't already a numpy array, convert it to one
-                            if not isinstance(slice_data, np.ndarray):
-                                try:
-                                    # Try to convert to numpy array
-                                    slice_data = np.array(slice_data)
-                                    logger.debug(f"Converted list slice to numpy array with shape: {slice_data.shape}, dtype: {slice_data.dtype}")
-                                except Exception as e:
-                                    logger.error(f"Failed to convert list slice to numpy array: {e}")
-                                    return None
-                        else:
-                            # Original case where volume.volume is a numpy array
-                            if slice_id >= volume.volume.shape[0]:
-                                logger.warning(f"Slice index {slice_id} out of bounds for volume {volume_id} in {file_name}. "
-                                               f"Volume shape: {volume.volume.shape}")
-                                return None
-                                
-                            # Get the slice data from the numpy array
-                            slice_data = volume.volume[slice_id]
-                            logger.debug(f"Successfully retrieved OCT slice {slice_id} from volume {volume_id} of {file_name}. "
-                                         f"Slice shape: {slice_data.shape}, dtype: {slice_data.dtype}")
-                        
-                        # Convert to uint8 for better display if needed
-                        if slice_data.dtype != np.uint8:
-                            # Normalize to 0-255 range
-                            normalized_data = ((slice_data - slice_data.min()) / 
-                                              (slice_data.max() - slice_data.min() + 1e-10) * 255).astype(np.uint8)
-                            logger.debug(f"Converted slice data from {slice_data.dtype} to uint8")
-                            return normalized_data
-                        return slice_data
-                        
-                    except ValueError as e:
-                        logger.error(f"Invalid frame ID format '{frame_id}': {e}")
-                    except Exception as e:
-                        logger.error(f"Error accessing OCT volume: {e}", exc_info=True)
-                
-                elif frame_id.startswith('fundus'):
-                    try:
-                        # Parse the image ID from the frame_id
-                        image_id = int(frame_id[6:])
-                        
-                        # Read all fundus images (following the example code)
-                        logger.debug(f"Reading fundus images for {file_name} to access image {image_id}")
-                        fundus_images = file_obj.read_fundus_image()
-                        
-                        if image_id >= len(fundus_images):
-                            logger.warning(f"Fundus image index {image_id} out of bounds in {file_name}. "
-                                           f"Available fundus images: {len(fundus_images)}")
-                            return None
-                            
-                        # Access the fundus image and convert to numpy array
-                        fundus_image = fundus_images[image_id]
-                        
-                        # Need to convert PIL image to numpy array
-                        if not hasattr(fundus_image, 'image') or fundus_image.image is None:
-                            # Try direct conversion
-                            img_buffer = io.BytesIO()
-                            fundus_image.save(img_buffer, format='PNG')
-                            img_buffer.seek(0)
-                            fundus_array = np.array(Image.open(img_buffer))
-                        else:
-                            # Use image attribute if available
-                            fundus_array = np.array(fundus_image.image)
-                            
-                        logger.debug(f"Successfully retrieved fundus image {image_id} from {file_name}. "
-                                     f"Image shape: {fundus_array.shape}, dtype: {fundus_array.dtype}")
-                        return fundus_array
-                        
-                    except ValueError as e:
-                        logger.error(f"Invalid fundus ID format '{frame_id}': {e}")
-                    except Exception as e:
-                        logger.error(f"Error accessing fundus image: {e}", exc_info=True)
-                else:
-                    logger.warning(f"Unknown frame ID format '{frame_id}' for E2E file")
-            
-            elif isinstance(file_obj, IMG):
-                if frame_id.startswith('slice'):
-                    try:
-                        # Parse the slice ID from the frame_id
-                        slice_id = int(frame_id[5:])
-                        
-                        # Read the OCT volume (following the example code)
-                        logger.debug(f"Reading OCT volume for IMG file {file_name} to access slice {slice_id}")
-                        oct_volume = file_obj.read_oct_volume()
-                        
-                        if not hasattr(oct_volume, 'volume') or oct_volume.volume is None:
-                            logger.warning(f"OCT volume in IMG file {file_name} has no 'volume' attribute or is None")
-                            return None
-                            
-                        if slice_id >= oct_volume.volume.shape[0]:
-                            logger.warning(f"Slice index {slice_id} out of bounds in IMG file {file_name}. "
-                                           f"Volume shape: {oct_volume.volume.shape}")
-                            return None
-                            
-                        # Get the slice data
-                        slice_data = oct_volume.volume[slice_id]
-                        logger.debug(f"Successfully retrieved slice {slice_id} from IMG file {file_name}. "
-                                     f"Slice shape: {slice_data.shape}, dtype: {slice_data.dtype}")
-                        
-                        # Convert to uint8 for better display if needed
-                        if slice_data.dtype != np.uint8:
-                            # Normalize to 0-255 range
-                            normalized_data = ((slice_data - slice_data.min()) / 
-                                              (slice_data.max() - slice_data.min() + 1e-10) * 255).astype(np.uint8)
-                            logger.debug(f"Converted slice data from {slice_data.dtype} to uint8")
-                            return normalized_data
-                        return slice_data
-                        
-                    except ValueError as e:
-                        logger.error(f"Invalid slice ID format '{frame_id}': {e}")
-                    except Exception as e:
-                        logger.error(f"Error accessing OCT volume in IMG file: {e}", exc_info=True)
-                else:
-                    logger.warning(f"Unknown frame ID format '{frame_id}' for IMG file")
+        # Convert to uint8 for better display if needed
+        if slice_data.dtype != np.uint8:
+            logger.debug("Converting slice data from %s to uint8", slice_data.dtype)
+        image = self._store_slice((file_id, volume_id, slice_id), self._slice_image(slice_data))
+        self._prefetch_slices(file_id, volume_id, volume_data, slice_id)
+        return image
+    
+    def _image_e2e(self, file_name: str, file_id: int, file_obj: Any, frame_id: str, match) -> Optional[np.ndarray]:
+        """Get an OCT slice (vol{v}_slice{s}) or fundus image (fundus{i}) of a Heidelberg E2E file."""
+        if match.group('vol') is not None:
+            volume_id = int(match.group('vol'))
+            slice_id = int(match.group('sl'))
+            
+            cached = self._get_cached_slice((file_id, volume_id, slice_id))
+            if cached is not None:
+                return cached
+            
+            # Read all OCT volumes (following the example code)
+            logger.debug("Reading OCT volumes for %s to access volume %s, slice %s", file_name, volume_id, slice_id)
+            try:
+                oct_volumes = self._get_oct_volumes(file_id, file_obj)
+            except Exception as e:
+                logger.error("Error accessing OCT volume in %s: %s", file_name, e, exc_info=True)
+                return None
+            
+            if volume_id >= len(oct_volumes):
+                logger.warning("Volume index %s out of bounds in %s. Available volumes: %s", volume_id, file_name, len(oct_volumes))
+                return None
+            
+            volume = oct_volumes[volume_id]
+            return self._read_slice(file_name, file_id, volume_id, volume, slice_id)
+        
+        if match.group('fund') is not None:
+            image_id = int(match.group('fund'))
+            
+            # Read all fundus images (following the example code)
+            logger.debug("Reading fundus images for %s to access image %s", file_name, image_id)
+            try:
+                fundus_images = self._get_fundus_images(file_id, file_obj)
+            except Exception as e:
+                logger.error("Error accessing fundus image in %s: %s", file_name, e, exc_info=True)
+                return None
+            
+            if image_id >= len(fundus_images):
+                logger.warning("Fundus image index %s out of bounds in %s. "
+                               "Available fundus images: %s", image_id, file_name, len(fundus_images))
+                return None
+            
+            # Access the fundus image and convert to numpy array
+            fundus_image = fundus_images[image_id]
+            
+            # Need to convert PIL image to numpy array
+            if not hasattr(fundus_image, 'image') or fundus_image.image is None:
+                # Try direct conversion; PIL images expose their pixels
+                # through __array_interface__, no PNG round-trip needed
+                fundus_array = np.asarray(fundus_image)
             else:
-                logger.warning(f"Unsupported file object type {type(file_obj)} for {file_name}")
+                # Use image attribute if available
+                fundus_array = np.asarray(fundus_image.image)
             
-            # Log detailed error message if we get here
-            logger.error(f"Could not get frame image data for frame {frame_id} in file {file_name}")
+            if fundus_array.dtype == object or fundus_array.ndim < 2:
+                logger.error("Fundus image %s in %s is not convertible to pixel data (%s)",
+                             image_id, file_name, type(fundus_image).__name__)
+                return None
+            
+            logger.debug("Successfully retrieved fundus image %s from %s. "
+                         "Image shape: %s, dtype: %s", image_id, file_name, fundus_array.shape, fundus_array.dtype)
+            return fundus_array
+        
+        logger.warning("Unknown frame ID format '%s' for E2E file", frame_id)
+        return None
+    
+    def _image_img(self, file_name: str, file_id: int, file_obj: Any, frame_id: str, match) -> Optional[np.ndarray]:
+        """Get an OCT slice (slice{s}) of a Zeiss IMG file."""
+        if match.group('isl') is not None:
+            slice_id = int(match.group('isl'))
+            
+            cached = self._get_cached_slice((file_id, 0, slice_id))
+            if cached is not None:
+                return cached
+            
+            # Read the OCT volume (following the example code)
+            logger.debug("Reading OCT volume for IMG file %s to access slice %s", file_name, slice_id)
+            try:
+                oct_volume = self._get_oct_volumes(file_id, file_obj)
+            except Exception as e:
+                logger.error("Error accessing OCT volume in IMG file %s: %s", file_name, e, exc_info=True)
+                return None
+            return self._read_slice(file_name, file_id, 0, oct_volume, slice_id)
+        
+        logger.warning("Unknown frame ID format '%s' for IMG file", frame_id)
+        return None
+    
+    # Frame image getters by file type tag; load_file picks one per file
+    _IMAGE_HANDLERS = {
+        'e2e': _image_e2e,
+        'img': _image_img,
+    }
+    
+    def get_frame_image(self, file_name: str, frame_id: str) -> Optional[np.ndarray]:
+        """
+        Get the image data for a specific frame.
+        
+        Args:
+            file_name: Name of the loaded file
+            frame_id: ID of the frame
+            
+        Returns:
+            Optional[np.ndarray]: Image data as a writable numpy array owned by the caller, or None if error
+        """
+        resolved = self._resolve(file_name)
+        if resolved is None:
+            logger.warning("Cannot get frame image: file '%s' not loaded", file_name)
             return None
         
-        except Exception as e:
-            logger.error(f"Error getting frame image from {file_name}, frame {frame_id}: {str(e)}", exc_info=True)
+        file_id, file_path, file_obj = resolved
+        logger.debug("Getting frame %s from file %s (path: %s)", frame_id, file_name, file_path)
+        
+        # Parse the frame ID once
+        match = _FRAME_RE.match(frame_id)
+        if match is None:
+            logger.warning("Unknown frame ID format '%s' for %s file", frame_id, self._file_types[file_id].upper())
             return None
+        
+        handler = self._image_handlers.get(file_id)
+        if handler is None:
+            logger.warning("Unsupported file object type %s for %s", type(file_obj), file_name)
+            logger.error("Could not get frame image data for frame %s in file %s", frame_id, file_name)
+            return None
+        
+        image = handler(self, file_name, file_id, file_obj, frame_id, match)
+        if image is not None and not image.flags.writeable:
+            # Cached slices (and arrays over PIL images) are shared and read-only
+            image = image.copy()
+        return image
+    
+    @staticmethod
+    def _read_dicom_manifest(manifest_path: str) -> Dict[str, Any]:
+        """
+        Read the DICOM export manifest of an output directory.
+        
+        Args:
+            manifest_path: Path to the manifest file
+            
+        Returns:
+            Dict[str, Any]: Export records keyed by source file path (empty if missing or unreadable)
+        """
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable DICOM export manifest {manifest_path}: {e}")
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+    
+    @staticmethod
+    def _write_dicom_manifest(manifest_path: str, manifest: Dict[str, Any]):
+        """
+        Write the DICOM export manifest of an output directory.
+        
+        Args:
+            manifest_path: Path to the manifest file
+            manifest: Export records keyed by source file path
+        """
+        try:
+            with open(manifest_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f)
+        except OSError as e:
+            logger.warning(f"Could not write DICOM export manifest {manifest_path}: {e}")
     
     def export_to_dicom(self, file_name: str, output_dir: str) -> Tuple[bool, str]:
         """
@@ -816,7 +1408,8 @@ class OCTFileReader:
         Returns:
             Tuple[bool, str]: (Success, Message)
         """
-        if file_name not in self.loaded_files:
+        resolved = self._resolve(file_name)
+        if resolved is None:
             error_msg = f"File not loaded: {file_name}"
             logger.error(error_msg)
             return False, error_msg
@@ -840,16 +1433,33 @@ class OCTFileReader:
             return False, error_msg
         
         try:
-            file_obj = self.loaded_files[file_name]
-            file_path = file_obj.filepath
+            _, file_path, _ = resolved
             
-            if not os.path.exists(file_path):
+            try:
+                source_stat = os.stat(file_path)
+            except FileNotFoundError:
                 error_msg = f"OCT file no longer exists at path: {file_path}"
                 logger.error(error_msg)
                 return False, error_msg
+            
+            # Skip the export if this exact source version was already exported here
+            manifest_path = os.path.join(output_dir, self._DICOM_MANIFEST_NAME)
+            manifest = self._read_dicom_manifest(manifest_path)
+            entry = manifest.get(file_path)
+            if (entry
+                    and entry.get('mtime') == source_stat.st_mtime
+                    and entry.get('size') == source_stat.st_size
+                    and entry.get('files')
+                    and all(os.path.exists(os.path.join(output_dir, f)) for f in entry['files'])):
+                logger.info(f"DICOM export of {file_name} is up to date in {output_dir}, skipping")
+                return True, f"{file_name} already exported to DICOM format ({len(entry['files'])} files, cached)"
+            
+            existing_files = {f for f in os.listdir(output_dir) if f.lower().endswith('.dcm')}
+            export_started = time.time()
                 
             # Create DICOM from OCT file
             logger.info(f"Starting DICOM export for {file_name} to {output_dir}")
+            from oct_converter.dicom import create_dicom_from_oct
             create_dicom_from_oct(file_path, output_dir=output_dir)
             
             # Verify that files were created
@@ -858,6 +1468,20 @@ class OCTFileReader:
                 logger.warning(f"DICOM export completed but no .dcm files found in {output_dir}")
             else:
                 logger.info(f"Successfully exported {len(created_files)} DICOM files to {output_dir}")
+            
+            # Remember the files this export wrote (new or rewritten) for the next call
+            written_files = sorted(
+                f for f in created_files
+                if f not in existing_files
+                or os.path.getmtime(os.path.join(output_dir, f)) >= export_started - 1
+            )
+            if written_files:
+                manifest[file_path] = {
+                    'mtime': source_stat.st_mtime,
+                    'size': source_stat.st_size,
+                    'files': written_files
+                }
+                self._write_dicom_manifest(manifest_path, manifest)
                 
             return True, f"Successfully exported {file_name} to DICOM format ({len(created_files)} files)"
         
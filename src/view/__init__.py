@@ -5,8 +5,28 @@
 __init__.py for view package
 """
 
-# Import all view classes for easier access
-from .import_dialog import ImportDialog
-from .export_dialog import ExportDialog
-from .settings_dialog import SettingsDialog
-from .frame_selector import FrameSelector
+import importlib
+
+# View classes are imported on first access (PEP 562) so importing one dialog
+# does not build the Qt widget classes of all the others
+_LAZY = {
+    'ImportDialog': '.import_dialog',
+    'ExportDialog': '.export_dialog',
+    'SettingsDialog': '.settings_dialog',
+    'FrameSelector': '.frame_selector',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
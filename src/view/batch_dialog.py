@@ -9,16 +9,28 @@ Dialog for batch processing OCT files.
 
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                            QPushButton, QFileDialog, QListWidget, QComboBox,
-                           QGroupBox, QCheckBox, QProgressBar, QMessageBox)
+                           QGroupBox, QCheckBox, QProgressBar, QMessageBox, QSlider)
 from PyQt5.QtCore import Qt, QThread, pyqtSignal
 
 import os
 import logging
+import queue
+import threading
+import time
+from pathlib import Path
+
+from .import_dialog import _OCT_FILE_FILTERS, _OCT_FILTER_STR
 
 logger = logging.getLogger(__name__)
 
 class BatchProcessWorker(QThread):
-    """Worker thread for batch processing."""
+    """Worker thread for batch processing.
+    
+    Files flow through a two-stage pipeline: a producer thread imports files
+    and reads their frame lists into a bounded queue, while a pool of consumer
+    threads exports them. This thread only starts the stages and reports
+    progress as files complete.
+    """
     
     # Signals
     progress_updated = pyqtSignal(int, int)  # (current, total)
@@ -26,10 +38,11 @@ class BatchProcessWorker(QThread):
     processing_file = pyqtSignal(str)  # file being processed
     processing_complete = pyqtSignal(bool, str)  # (success, message)
     
-    # Cancel flag
-    _cancel_requested = False
+    # Minimum seconds between file progress emissions (~30 Hz)
+    PROGRESS_EMIT_INTERVAL = 0.033
     
-    def __init__(self, file_controller, export_controller, files, export_dir, export_settings):
+    def __init__(self, file_controller, export_controller, files, export_dir, export_settings, prefetch_depth=2,
+                 buffer_pool=None):
         """
         Initialize the worker.
         
@@ -39,6 +52,8 @@ class BatchProcessWorker(QThread):
             files: List of file paths to process
             export_dir: Directory to export to
             export_settings: Export settings dictionary
+            prefetch_depth: Number of imported files allowed to wait for export (1-5)
+            buffer_pool: Optional FrameBufferPool shared by all export threads
         """
         super().__init__()
         self.file_controller = file_controller
@@ -46,84 +61,333 @@ class BatchProcessWorker(QThread):
         self.files = files
         self.export_dir = export_dir
         self.export_settings = export_settings
-        self._cancel_requested = False
+        self.prefetch_depth = prefetch_depth
+        self.buffer_pool = buffer_pool
+        self._cancel_event = threading.Event()
+        self._created_dirs = set()
+        self._last_emit_time = 0.0
+        self._last_emit_pct = -1
+        
+        # Export task whose progress drives the file progress bar and label;
+        # other concurrent exports report only through the overall count
+        self._progress_owner = None
+        self._progress_lock = threading.Lock()
     
     def cancel(self):
         """Request cancellation of the batch process."""
         logger.info("Batch processing cancellation requested")
-        self._cancel_requested = True
+        self._cancel_event.set()
+    
+    def _owns_progress(self, task):
+        """
+        Check whether a task reports file progress, claiming the display if it is free.
+        
+        Args:
+            task: Export task from _import_one_file
+            
+        Returns:
+            bool: True if the task's progress should be emitted
+        """
+        with self._progress_lock:
+            if self._progress_owner is task:
+                return True
+            if self._progress_owner is not None:
+                return False
+            self._progress_owner = task
+            self._last_emit_pct = -1
+        self.processing_file.emit(task[0])
+        return True
+    
+    def _release_progress(self, task):
+        """Free the file progress display if the task holds it."""
+        with self._progress_lock:
+            if self._progress_owner is task:
+                self._progress_owner = None
+    
+    def _emit_file_progress(self, progress):
+        """
+        Emit file_progress_updated, coalesced to whole-percent changes at ~30 Hz.
+        
+        Completion is always emitted. Only the task owning the display calls
+        this, see _owns_progress.
+        
+        Args:
+            progress: File progress (0-1)
+        """
+        pct = int(progress * 100)
+        if pct == self._last_emit_pct:
+            return
+        now = time.monotonic()
+        if progress < 1.0 and now - self._last_emit_time < self.PROGRESS_EMIT_INTERVAL:
+            return
+        self._last_emit_time = now
+        self._last_emit_pct = pct
+        self.file_progress_updated.emit(progress)
+    
+    def _create_task_controllers(self):
+        """
+        Create an independent reader/controller set for one file task.
+        
+        The shared controllers keep per-file state (loaded files, caches, the
+        current export directory), so each task gets its own instances built
+        from the same classes.
+        
+        Returns:
+            Tuple[FileController, ExportController]: Controllers for the task
+        """
+        oct_reader = type(self.file_controller.oct_reader)()
+        file_manager = type(self.file_controller.file_manager)()
+        file_controller = type(self.file_controller)(oct_reader, file_manager)
+        export_controller = type(self.export_controller)(
+            file_manager, oct_reader, self.export_controller.image_controller
+        )
+        return file_controller, export_controller
+    
+    @staticmethod
+    def _release_task(file_controller, file_name):
+        """Close the task's file and remove its reader's temporary files."""
+        file_controller.oct_reader.close_file(file_name)
+        file_controller.oct_reader.cleanup_temp_files()
+    
+    def _build_plan(self, files):
+        """
+        Resolve the name and export directory of each file.
+        
+        Files are exported concurrently, so each one gets its own directory:
+        a stem that repeats (a/scan.e2e and b/scan.e2e, or scan.e2e and
+        scan.img) gets a numeric suffix instead of sharing the folder.
+        
+        Args:
+            files: List of file paths
+            
+        Returns:
+            List[Tuple[str, str, str]]: (file_path, file_name, file_export_dir) tuples
+        """
+        plan = []
+        used_dirs = set()
+        for file_path in files:
+            stem = Path(file_path).stem
+            file_export_dir = os.path.join(self.export_dir, stem)
+            counter = 1
+            while os.path.normcase(file_export_dir) in used_dirs:
+                file_export_dir = os.path.join(self.export_dir, f"{stem}_{counter}")
+                counter += 1
+            used_dirs.add(os.path.normcase(file_export_dir))
+            plan.append((file_path, os.path.basename(file_path), file_export_dir))
+        return plan
+    
+    def _import_one_file(self, file_path, file_name, file_export_dir, hint=None):
+        """
+        Import a single file and read its frame list.
+        
+        Args:
+            file_path: Path to the file
+            file_name: Base name of the file
+            file_export_dir: Export directory for the file's frames
+            hint: FormatInfo from the probe pass, if the file was probed
+            
+        Returns:
+            Tuple[Optional[tuple], Optional[str]]: (Export task, Error message); the task is
+                (file_name, frames, file_export_dir, file_controller, export_controller)
+        """
+        file_controller = None
+        try:
+            file_controller, export_controller = self._create_task_controllers()
+            
+            # Import file
+            success, message = file_controller.import_file(file_path, hint=hint)
+            if not success:
+                logger.error(f"Error importing {file_name}: {message}")
+                self._release_task(file_controller, file_name)
+                return None, f"Error importing {file_name}: {message}"
+            
+            # Get frames
+            frames = file_controller.oct_reader.get_frames(file_name)
+            if not frames:
+                logger.warning(f"No frames found in {file_name}")
+                self._release_task(file_controller, file_name)
+                return None, f"No frames found in {file_name}"
+            
+            return (file_name, frames, file_export_dir, file_controller, export_controller), None
+        
+        except Exception as e:
+            logger.exception(f"Exception importing {file_name}: {e}")
+            if file_controller is not None:
+                self._release_task(file_controller, file_name)
+            return None, f"Error processing {file_name}: {str(e)}"
+    
+    def _export_one_file(self, task):
+        """
+        Export the frames of an imported file.
         
+        Args:
+            task: Export task from _import_one_file
+            
+        Returns:
+            Tuple[bool, Optional[str]]: (Success, Error message)
+        """
+        file_name, frames, file_export_dir, file_controller, export_controller = task
+        try:
+            # Export frames with progress tracking
+            def file_progress_callback(progress):
+                # Update the file-specific progress
+                if self._owns_progress(task):
+                    self._emit_file_progress(progress)
+                # Check if cancellation was requested
+                return not self._cancel_event.is_set()
+            
+            # Export frames
+            export_success, export_message = export_controller.export_frames(
+                frames,
+                file_export_dir,
+                self.export_settings,
+                file_progress_callback,
+                buffer_pool=self.buffer_pool
+            )
+            
+            if not export_success:
+                logger.error(f"Error exporting {file_name}: {export_message}")
+                return False, f"Error exporting {file_name}: {export_message}"
+            
+            logger.info(f"Successfully processed {file_name}")
+            return True, None
+        
+        except Exception as e:
+            logger.exception(f"Exception exporting {file_name}: {e}")
+            return False, f"Error processing {file_name}: {str(e)}"
+        
+        finally:
+            self._release_progress(task)
+            try:
+                self._release_task(file_controller, file_name)
+            except Exception as e:
+                logger.exception(f"Error releasing {file_name}: {e}")
+    
+    def _produce(self, plan, hints, import_queue, result_queue, consumer_count):
+        """
+        Producer stage: import files into the bounded queue.
+        
+        Every file posts exactly one result, even if importing it raises, and
+        files left over after a cancellation are reported as skipped, so the
+        result count always matches the file count. The end sentinels are
+        always sent so the consumers never wait forever.
+        
+        Args:
+            plan: List of (file_path, file_name, file_export_dir) tuples
+            hints: FormatInfo by file path from the preflight probe
+            import_queue: Bounded queue of export tasks
+            result_queue: Queue of per-file (success, error message) results
+            consumer_count: Number of consumers to send the end sentinel to
+        """
+        try:
+            for file_path, file_name, file_export_dir in plan:
+                if self._cancel_event.is_set():
+                    result_queue.put((False, None))
+                    continue
+                
+                try:
+                    task, error_message = self._import_one_file(
+                        file_path, file_name, file_export_dir, hints[file_path]
+                    )
+                    if task is None:
+                        result_queue.put((False, error_message))
+                    else:
+                        import_queue.put(task)
+                except Exception as e:
+                    logger.exception(f"Exception queuing {file_name}: {e}")
+                    result_queue.put((False, f"Error processing {file_name}: {str(e)}"))
+        finally:
+            # One sentinel per consumer
+            for _ in range(consumer_count):
+                import_queue.put(None)
+    
+    def _consume(self, import_queue, result_queue):
+        """
+        Consumer stage: export imported files until the sentinel arrives.
+        
+        Every task posts exactly one result, even if exporting or releasing it raises.
+        """
+        while True:
+            task = import_queue.get()
+            if task is None:
+                return
+            
+            result = (False, None)
+            try:
+                if self._cancel_event.is_set():
+                    # Drain without exporting
+                    self._release_task(task[3], task[0])
+                else:
+                    result = self._export_one_file(task)
+            except Exception as e:
+                logger.exception(f"Exception exporting {task[0]}: {e}")
+                result = (False, f"Error processing {task[0]}: {str(e)}")
+            finally:
+                result_queue.put(result)
+    
     def run(self):
         """Run the batch processing."""
-        total_files = len(self.files)
+        # Preflight: stat and sniff all files in parallel, and drop unreadable or
+        # corrupt ones before they reach the pipeline
+        hints, probe_errors = self.file_controller.probe_files(self.files)
+        files = [file_path for file_path in self.files if file_path in hints]
+        
+        total_files = len(files)
         processed_files = 0
         success_count = 0
-        error_count = 0
-        error_messages = []
+        error_count = len(probe_errors)
+        error_messages = [f"Skipped {os.path.basename(path)}: {message}"
+                          for path, message in probe_errors.items()]
+        
+        # Leave headroom for the GUI thread, this thread and the producer
+        consumer_count = max(1, min(QThread.idealThreadCount() - 2, total_files))
+        # maxsize=0 would make the queue unbounded, so clamp to at least one file
+        import_queue = queue.Queue(maxsize=max(1, self.prefetch_depth))
+        result_queue = queue.Queue()
+        logger.info(f"Batch processing {total_files} files with {consumer_count} export threads "
+                    f"and prefetch depth {self.prefetch_depth}")
         
         try:
-            for file_path in self.files:
-                # Check if cancellation was requested
-                if self._cancel_requested:
-                    logger.info("Batch processing canceled by user")
-                    self.processing_complete.emit(False, "Batch processing canceled by user")
-                    return
-                    
-                # Update progress
+            # Resolve names and export directories once, and create the directories up front
+            plan = self._build_plan(files)
+            for _, _, file_export_dir in plan:
+                if file_export_dir not in self._created_dirs:
+                    os.makedirs(file_export_dir, exist_ok=True)
+                    self._created_dirs.add(file_export_dir)
+            
+            producer = threading.Thread(
+                target=self._produce, args=(plan, hints, import_queue, result_queue, consumer_count),
+                name="batch_import", daemon=True
+            )
+            consumers = [
+                threading.Thread(target=self._consume, args=(import_queue, result_queue),
+                                 name=f"batch_export_{i}", daemon=True)
+                for i in range(consumer_count)
+            ]
+            producer.start()
+            for consumer in consumers:
+                consumer.start()
+            
+            for _ in range(total_files):
+                success, error_message = result_queue.get()
                 processed_files += 1
                 self.progress_updated.emit(processed_files, total_files)
                 
-                file_name = os.path.basename(file_path)
-                self.processing_file.emit(file_name)
-                
-                try:
-                    # Import file
-                    success, message = self.file_controller.import_file(file_path)
-                    
-                    if success:
-                        # Get frames
-                        frames = self.file_controller.frame_controller.get_available_frames(file_name)
-                        
-                        if frames:
-                            # Create file-specific export directory
-                            file_export_dir = os.path.join(self.export_dir, os.path.splitext(file_name)[0])
-                            os.makedirs(file_export_dir, exist_ok=True)
-                            
-                            # Export frames with progress tracking
-                            def file_progress_callback(progress):
-                                # Update the file-specific progress
-                                self.file_progress_updated.emit(progress)
-                                # Check if cancellation was requested
-                                return not self._cancel_requested
-                                
-                            # Export frames
-                            export_success, export_message = self.export_controller.export_frames(
-                                frames,
-                                file_export_dir,
-                                self.export_settings,
-                                file_progress_callback
-                            )
-                            
-                            if export_success:
-                                success_count += 1
-                                logger.info(f"Successfully processed {file_name}")
-                            else:
-                                error_count += 1
-                                error_messages.append(f"Error exporting {file_name}: {export_message}")
-                                logger.error(f"Error exporting {file_name}: {export_message}")
-                        else:
-                            error_count += 1
-                            error_messages.append(f"No frames found in {file_name}")
-                            logger.warning(f"No frames found in {file_name}")
-                    else:
-                        error_count += 1
-                        error_messages.append(f"Error importing {file_name}: {message}")
-                        logger.error(f"Error importing {file_name}: {message}")
-                        
-                except Exception as e:
+                if success:
+                    success_count += 1
+                elif error_message:
                     error_count += 1
-                    error_messages.append(f"Error processing {file_name}: {str(e)}")
-                    logger.exception(f"Exception processing {file_name}: {e}")
+                    error_messages.append(error_message)
+            
+            producer.join()
+            for consumer in consumers:
+                consumer.join()
+            
+            # Check if cancellation was requested
+            if self._cancel_event.is_set():
+                logger.info("Batch processing canceled by user")
+                self.processing_complete.emit(False, "Batch processing canceled by user")
+                return
             
             # Emit completion signal
             if error_count == 0:
@@ -138,7 +402,7 @@ class BatchProcessWorker(QThread):
 class BatchDialog(QDialog):
     """Dialog for batch processing OCT files."""
     
-    def __init__(self, parent=None, file_controller=None, export_controller=None):
+    def __init__(self, parent=None, file_controller=None, export_controller=None, buffer_pool=None):
         """
         Initialize the batch processing dialog.
         
@@ -146,13 +410,16 @@ class BatchDialog(QDialog):
             parent: Parent widget
             file_controller: FileController instance
             export_controller: ExportController instance
+            buffer_pool: Optional FrameBufferPool for export conversion buffers
         """
         super().__init__(parent)
         
         self.file_controller = file_controller
         self.export_controller = export_controller
+        self.buffer_pool = buffer_pool
         self.selected_files = []
         self.worker = None
+        self._last_filter = _OCT_FILE_FILTERS[0]
         
         # Setup UI
         self.init_ui()
@@ -237,6 +504,21 @@ class BatchDialog(QDialog):
         self.create_subfolder_checkbox.setChecked(True)
         export_settings_layout.addWidget(self.create_subfolder_checkbox)
         
+        # Import prefetch depth
+        prefetch_layout = QHBoxLayout()
+        prefetch_label = QLabel("Files imported ahead:")
+        self.prefetch_slider = QSlider(Qt.Horizontal)
+        self.prefetch_slider.setRange(1, 5)
+        self.prefetch_slider.setValue(2)
+        self.prefetch_slider.setToolTip("Number of imported files that may wait for export. "
+                                        "Higher values overlap file reading with export but use more memory.")
+        self.prefetch_value_label = QLabel(str(self.prefetch_slider.value()))
+        self.prefetch_slider.valueChanged.connect(lambda value: self.prefetch_value_label.setText(str(value)))
+        prefetch_layout.addWidget(prefetch_label)
+        prefetch_layout.addWidget(self.prefetch_slider)
+        prefetch_layout.addWidget(self.prefetch_value_label)
+        export_settings_layout.addLayout(prefetch_layout)
+        
         export_settings_group.setLayout(export_settings_layout)
         export_layout.addWidget(export_settings_group)
         
@@ -282,41 +564,45 @@ class BatchDialog(QDialog):
         
         main_layout.addLayout(button_layout)
         
+        # Widgets disabled while a batch is running
+        self._toggle_widgets = [
+            self.browse_button,
+            self.browse_export_button,
+            self.format_combo,
+            self.duplicate_combo,
+            self.export_metadata_checkbox,
+            self.create_subfolder_checkbox,
+            self.prefetch_slider,
+            self.process_button,
+        ]
+        
         # Reset UI
         self.progress_bar.setValue(0)
         self.file_progress_bar.setValue(0)
     
     def browse_files(self):
         """Browse for files to process."""
-        # Include all supported formats by default
-        filters = [
-            "All Supported OCT Files (*.e2e *.E2E *.img *.IMG *.fds *.FDS *.fda *.FDA *.oct *.OCT *.poct *.POCT *.dcm *.DCM)",
-            "Heidelberg OCT (*.e2e *.E2E)",
-            "Zeiss Cirrus OCT (*.img *.IMG)",
-            "Topcon OCT (*.fds *.FDS *.fda *.FDA)",
-            "Bioptigen OCT (*.oct *.OCT)",
-            "POCT Files (*.poct *.POCT)",
-            "DICOM Files (*.dcm *.DCM)",
-            "All Files (*)"
-        ]
-        
-        filter_str = ";;".join(filters)
-        
-        # Open file dialog
-        files, _ = QFileDialog.getOpenFileNames(
+        # Open file dialog, starting from the filter picked last time
+        files, selected_filter = QFileDialog.getOpenFileNames(
             self,
             "Select OCT Files",
             "",
-            filter_str
+            _OCT_FILTER_STR,
+            self._last_filter
         )
+        if selected_filter:
+            self._last_filter = selected_filter
         
         if files:
             self.selected_files = files
             
-            # Update file list
-            self.file_list.clear()
-            for file_path in files:
-                self.file_list.addItem(file_path)
+            # Update file list in one call, without intermediate repaints
+            self.file_list.setUpdatesEnabled(False)
+            try:
+                self.file_list.clear()
+                self.file_list.addItems(files)
+            finally:
+                self.file_list.setUpdatesEnabled(True)
             
             # Update label
             if len(files) == 1:
@@ -361,6 +647,7 @@ class BatchDialog(QDialog):
             'crop': False,     # No cropping in batch mode
             'crop_params': {},
             'export_metadata': self.export_metadata_checkbox.isChecked(),
+            'metadata_mode': 'combined',  # One metadata JSON per source file
             'on_duplicate': self.duplicate_combo.currentData()  # Add duplicate handling option
         }
         
@@ -373,7 +660,9 @@ class BatchDialog(QDialog):
             self.export_controller,
             self.selected_files,
             self.export_path.text(),
-            export_settings
+            export_settings,
+            prefetch_depth=self.prefetch_slider.value(),
+            buffer_pool=self.buffer_pool
         )
         
         # Connect worker signals
@@ -422,13 +711,14 @@ class BatchDialog(QDialog):
     
     def setUIEnabled(self, enabled):
         """Enable or disable UI elements."""
-        self.browse_button.setEnabled(enabled)
-        self.browse_export_button.setEnabled(enabled)
-        self.format_combo.setEnabled(enabled)
-        self.export_metadata_checkbox.setEnabled(enabled)
-        self.create_subfolder_checkbox.setEnabled(enabled)
-        self.process_button.setEnabled(enabled)
-        self.cancel_button.setEnabled(not enabled)
+        # Suspend repaints so the toggles land in a single update
+        self.setUpdatesEnabled(False)
+        try:
+            for widget in self._toggle_widgets:
+                widget.setEnabled(enabled)
+            self.cancel_button.setEnabled(not enabled)
+        finally:
+            self.setUpdatesEnabled(True)
         
     def cancel_processing(self):
         """Cancel the batch processing operation."""
@@ -5,20 +5,269 @@
 Frame Selector Widget
 --------------------
 Widget for selecting frames from OCT files.
+
+Frames are shown in a QListView backed by a list model, so Qt only paints
+the rows in the viewport instead of holding a widget per frame.
 """
 
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                           QScrollArea, QGridLayout, QCheckBox, QPushButton)
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
+                           QListView, QStyledItemDelegate, QStyleOptionViewItem,
+                           QStyle, QApplication, QAbstractItemView)
+from PyQt5.QtCore import Qt, pyqtSignal, QAbstractListModel, QModelIndex, QRect, QSize
+from PyQt5.QtGui import QPixmap, QImage, QIcon, QFont, QFontMetrics, QColor, QPalette
 import os
+import hashlib
+from collections import OrderedDict
 import numpy as np
-from PIL import Image
-import io
+
+try:
+    import xxhash
+except ImportError:  # xxhash is optional; previews are hashed with blake2b without it
+    xxhash = None
+
+# Item data role carrying the frame type string
+FRAME_TYPE_ROLE = Qt.UserRole + 1
+
+# Edge length of frame preview thumbnails
+PREVIEW_SIZE = 100
+
+# QImage formats for uint8 arrays by channel count
+_QIMAGE_FORMATS = {1: QImage.Format_Grayscale8, 3: QImage.Format_RGB888, 4: QImage.Format_RGBA8888}
+
+
+def _preview_pixmap(image_data):
+    """
+    Build a preview-sized QPixmap straight from a numpy array.
+    
+    The QImage wraps the array's memory without copying; scaling it down to
+    PREVIEW_SIZE produces the owned copy that the pixmap is made from.
+    
+    Args:
+        image_data: 2D grayscale or HxWx3/HxWx4 image array
+        
+    Returns:
+        Optional[QPixmap]: Preview pixmap, or None for unsupported shapes
+    """
+    channels = 1 if image_data.ndim == 2 else (image_data.shape[2] if image_data.ndim == 3 else 0)
+    image_format = _QIMAGE_FORMATS.get(channels)
+    if image_format is None or image_data.size == 0:
+        return None
+    
+    if image_data.dtype != np.uint8:
+        # Min-max normalize to uint8 for display
+        vmin = float(image_data.min())
+        vmax = float(image_data.max())
+        scaled = image_data.astype(np.float32)
+        scaled -= vmin
+        scaled *= np.float32(255.0 / (vmax - vmin + 1e-10))
+        image_data = scaled.astype(np.uint8)
+    if channels == 1 and image_data.ndim == 3:
+        image_data = image_data[:, :, 0]
+    
+    arr = np.ascontiguousarray(image_data)
+    height, width = arr.shape[:2]
+    qimage = QImage(arr.data, width, height, arr.strides[0], image_format)
+    preview = qimage.scaled(PREVIEW_SIZE, PREVIEW_SIZE, Qt.KeepAspectRatio, Qt.FastTransformation)
+    return QPixmap.fromImage(preview)
+
+
+class _FrameListModel(QAbstractListModel):
+    """List model over a frame sequence; check state is kept as a set of rows."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.frames = []
+        self.checked_rows = set()
+        self.previews = {}  # row -> QPixmap
+        self._row_by_id = None
+    
+    def set_frames(self, frames):
+        """Replace the frames, clearing check state and previews."""
+        self.beginResetModel()
+        self.frames = frames
+        self.checked_rows = set()
+        self.previews = {}
+        self._row_by_id = None
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.frames)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if row in self.checked_rows else Qt.Unchecked
+        if role == Qt.DecorationRole:
+            return self.previews.get(row)
+        if role == Qt.DisplayRole:
+            return self.frames[row]['id']
+        if role == FRAME_TYPE_ROLE:
+            return self.frames[row].get('type', '')
+        if role == Qt.ToolTipRole:
+            frame = self.frames[row]
+            return f"{frame['id']} ({frame.get('type', 'unknown')})"
+        return None
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.CheckStateRole:
+            return False
+        row = index.row()
+        checked = value == Qt.Checked
+        if checked == (row in self.checked_rows):
+            return True
+        if checked:
+            self.checked_rows.add(row)
+        else:
+            self.checked_rows.discard(row)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+    
+    def set_checked_rows(self, rows):
+        """Replace the checked rows and notify views with a single dataChanged."""
+        if rows == self.checked_rows:
+            return
+        self.checked_rows = rows
+        if self.frames:
+            self.dataChanged.emit(self.index(0), self.index(len(self.frames) - 1), [Qt.CheckStateRole])
+    
+    def row_of(self, frame_id):
+        """Get the row of a frame ID, or None if it is not in the model."""
+        if self._row_by_id is None:
+            self._row_by_id = {frame['id']: row for row, frame in enumerate(self.frames)}
+        return self._row_by_id.get(frame_id)
+    
+    def set_previews(self, pixmaps):
+        """Set preview pixmaps for several rows, notifying views with one dataChanged."""
+        if not pixmaps:
+            return
+        self.previews.update(pixmaps)
+        self.dataChanged.emit(self.index(min(pixmaps)), self.index(max(pixmaps)), [Qt.DecorationRole])
+
+
+class _FrameItemDelegate(QStyledItemDelegate):
+    """Paints a frame as check box, optional preview, bold ID and small type line."""
+    
+    ITEM_WIDTH = 120
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._id_font = QFont()
+        self._id_font.setBold(True)
+        self._id_font.setPointSize(8)
+        self._type_font = QFont()
+        self._type_font.setPointSize(7)
+        self._type_color = QColor('#666')
+        
+        # Every item has the same size, so compute it once from the font metrics
+        self._id_height = QFontMetrics(self._id_font).height()
+        self._type_height = QFontMetrics(self._type_font).height()
+        self._fixed_size = QSize(self.ITEM_WIDTH, self._id_height + self._type_height + 4)
+        self._preview_fixed_size = QSize(self.ITEM_WIDTH, self._fixed_size.height() + PREVIEW_SIZE + 1)
+    
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        widget = opt.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        
+        # Let the style draw the background and check box, then draw the rest
+        opt.text = ''
+        opt.icon = QIcon()
+        opt.features &= ~QStyleOptionViewItem.HasDecoration
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, widget)
+        text_rect = style.subElementRect(QStyle.SE_ItemViewItemText, opt, widget)
+        
+        painter.save()
+        pixmap = index.data(Qt.DecorationRole)
+        if pixmap is not None:
+            preview_rect = QRect(text_rect.left(), text_rect.top(), PREVIEW_SIZE, PREVIEW_SIZE)
+            painter.drawPixmap(preview_rect, pixmap)
+            text_rect.setTop(preview_rect.bottom() + 1)
+        
+        painter.setFont(self._id_font)
+        painter.setPen(opt.palette.color(QPalette.Text))
+        id_rect = QRect(text_rect.left(), text_rect.top(), text_rect.width(), self._id_height)
+        painter.drawText(id_rect, Qt.AlignLeft | Qt.AlignVCenter, index.data(Qt.DisplayRole))
+        
+        type_text = index.data(FRAME_TYPE_ROLE)
+        if type_text:
+            painter.setFont(self._type_font)
+            painter.setPen(self._type_color)
+            type_rect = QRect(text_rect.left(), id_rect.bottom() + 1, text_rect.width(), self._type_height)
+            painter.drawText(type_rect, Qt.AlignLeft | Qt.AlignVCenter, str(type_text))
+        painter.restore()
+    
+    def sizeHint(self, option, index):
+        model = index.model()
+        if model is not None and model.previews:
+            return self._preview_fixed_size
+        return self._fixed_size
+
+
+def _downscale_stack(stack):
+    """
+    Downscale a stack of equally sized grayscale images to roughly preview size.
+    
+    Each image is reduced by block averaging over k x k blocks, with k chosen
+    so the result is close to PREVIEW_SIZE, in one vectorized operation over
+    the whole stack. Non-uint8 stacks are min-max normalized per image.
+    
+    Args:
+        stack: N x H x W array
+        
+    Returns:
+        np.ndarray: N x h x w uint8 array
+    """
+    n, height, width = stack.shape
+    is_uint8 = stack.dtype == np.uint8
+    k = min(max(height, width) // PREVIEW_SIZE, height, width)
+    if k >= 2:
+        height, width = height // k, width // k
+        stack = stack[:, :height * k, :width * k].reshape(n, height, k, width, k).mean(axis=(2, 4), dtype=np.float32)
+    
+    if is_uint8:
+        return stack.astype(np.uint8)
+    
+    # np.stack and the block mean both return fresh arrays, so normalize in place
+    if stack.dtype != np.float32:
+        stack = stack.astype(np.float32)
+    vmin = stack.min(axis=(1, 2), keepdims=True)
+    vmax = stack.max(axis=(1, 2), keepdims=True)
+    stack -= vmin
+    stack *= np.float32(255.0) / (vmax - vmin + np.float32(1e-10))
+    return stack.astype(np.uint8)
+
+
+def _content_hash(array):
+    """
+    Hash an array's contents for the preview cache.
+    
+    Args:
+        array: Numpy array
+        
+    Returns:
+        Union[int, bytes]: 64-bit content digest
+    """
+    data = memoryview(np.ascontiguousarray(array)).cast('B')
+    if xxhash is not None:
+        return xxhash.xxh64_intdigest(data)
+    return hashlib.blake2b(data, digest_size=8).digest()
+
 
 class FrameSelector(QWidget):
     """Widget for selecting frames from OCT files."""
     
+    # Maximum number of preview pixmaps kept for reuse
+    _PREVIEW_CACHE_MAX = 128
+    
     # Signal emitted when frame selection changes
     selectionChanged = pyqtSignal()
     # Signal emitted when a frame is clicked for preview
@@ -28,9 +277,11 @@ class FrameSelector(QWidget):
         """Initialize the frame selector widget."""
         super().__init__(parent)
         
-        self.frames = []  # List of frame information dictionaries
-        self.selected_frames = []  # List of selected frame IDs
-        self.frame_widgets = {}  # Dictionary mapping frame IDs to widgets
+        self.frames = []  # Sequence of frame information dictionaries
+        self.frame_model = _FrameListModel(self)
+        self.frame_model.dataChanged.connect(self._on_frame_data_changed)
+        # (frame_id, shape, dtype, content hash) -> QPixmap, least recently used first
+        self._preview_cache = OrderedDict()
         
         # Setup UI
         self.init_ui()
@@ -59,206 +310,144 @@ class FrameSelector(QWidget):
         
         main_layout.addLayout(button_layout)
         
-        # Create scroll area that will contain all frames
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setFrameShape(QScrollArea.StyledPanel)
-        self.scroll_area.setWidgetResizable(True)  # IMPORTANT: Allow widget to resize
-        self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)  # Always show vertical scrollbar
-        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        
-        # Frame container widget
-        self.frame_container = QWidget()
-        
-        # Create a flow layout for the frames
-        self.frame_layout = QVBoxLayout(self.frame_container)
-        self.frame_layout.setContentsMargins(2, 2, 2, 2)
-        self.frame_layout.setSpacing(2)
-        self.frame_layout.setAlignment(Qt.AlignTop)  # Important: Align frames to top
-        
-        # Set the container widget as the scroll area's widget
-        self.scroll_area.setWidget(self.frame_container)
-        
-        # Add scroll area to main layout
-        main_layout.addWidget(self.scroll_area, 1)  # Give stretch factor to ensure it expands
-        
+        # Frame list: items flow left to right and wrap, like a grid
+        self.list_view = QListView()
+        self.list_view.setModel(self.frame_model)
+        self.list_view.setItemDelegate(_FrameItemDelegate(self.list_view))
+        self.list_view.setFlow(QListView.LeftToRight)
+        self.list_view.setWrapping(True)
+        self.list_view.setResizeMode(QListView.Adjust)
+        self.list_view.setUniformItemSizes(True)  # Lets the view skip per-item size queries
+        self.list_view.setLayoutMode(QListView.Batched)  # Lay out large frame lists across event loop passes
+        self.list_view.setBatchSize(64)
+        self.list_view.setSpacing(2)
+        self.list_view.setSelectionMode(QAbstractItemView.NoSelection)  # Check boxes carry the selection
+        self.list_view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)  # Always show vertical scrollbar
+        self.list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.list_view.clicked.connect(self._on_frame_clicked)
+        
+        # Add list view to main layout
+        main_layout.addWidget(self.list_view, 1)  # Give stretch factor to ensure it expands
+    
     def set_frames(self, frames):
         """
         Set the frames to display.
         
         Args:
-            frames: List of frame information dictionaries
+            frames: Sequence of frame information dictionaries
         """
         self.frames = frames
-        self.selected_frames = []
-        self.frame_widgets = {}
-        
-        # Clear existing frames from layout
-        while self.frame_layout.count():
-            item = self.frame_layout.takeAt(0)
-            if item.widget():
-                item.widget().setParent(None)
-        
-        # Create a multi-column flow layout using a grid
-        flow_widget = QWidget()
-        flow_layout = QGridLayout(flow_widget)
-        flow_layout.setContentsMargins(2, 2, 2, 2)
-        flow_layout.setSpacing(2)
-        
-        # Add frames to the flow layout
-        row, col = 0, 0
-        max_cols = 10  # Increased number of columns to fit more frames horizontally
-        
-        for i, frame in enumerate(frames):
-            frame_widget = self._create_frame_widget(frame)
-            flow_layout.addWidget(frame_widget, row, col)
-            
-            # Update row and column
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
-        
-        # Add the flow widget to the main frame layout
-        self.frame_layout.addWidget(flow_widget)
+        self.frame_model.set_frames(frames)
         
         # Emit signal
         self.selectionChanged.emit()
     
-    def _create_frame_widget(self, frame):
+    @property
+    def selected_frames(self):
+        """Set of selected frame IDs."""
+        return {self.frames[row]['id'] for row in self.frame_model.checked_rows}
+    
+    def selected_count(self):
         """
-        Create a widget for a frame.
+        Get the number of selected frames without building their IDs.
         
-        Args:
-            frame: Frame information dictionary
-            
         Returns:
-            QWidget: Frame widget
+            int: Number of selected frames
         """
-        frame_id = frame['id']
-        
-        # Create widget
-        frame_widget = QWidget()
-        frame_widget.setStyleSheet("QWidget:hover { background-color: #e0e0e0; }")
-        frame_widget.setMaximumWidth(120)  # Limit maximum width
-        frame_layout = QHBoxLayout(frame_widget)
-        frame_layout.setContentsMargins(2, 1, 2, 1)  # Minimal margins
-        frame_layout.setSpacing(1)  # Minimal spacing
-        
-        # Checkbox for selection
-        checkbox = QCheckBox()
-        checkbox.setChecked(False)
-        checkbox.setStyleSheet("QCheckBox { margin: 0; padding: 0; }")
-        checkbox.stateChanged.connect(lambda state, fid=frame_id: self._on_frame_selected(fid, state))
-        
-        # Create a widget for frame info
-        frame_info_widget = QWidget()
-        frame_info_layout = QVBoxLayout(frame_info_widget)
-        frame_info_layout.setContentsMargins(0, 0, 0, 0)
-        frame_info_layout.setSpacing(0)
-        
-        # Label for frame ID
-        id_label = QLabel(frame_id)
-        id_label.setStyleSheet("font-weight: bold; font-size: 8pt;")
-        frame_info_layout.addWidget(id_label)
-        
-        # Label for showing frame type
-        if 'type' in frame:
-            type_text = f"{frame['type']}"
-            type_label = QLabel(type_text)
-            type_label.setStyleSheet("font-size: 7pt; color: #666;")
-            frame_info_layout.addWidget(type_label)
-        
-        # Add to main layout
-        frame_layout.addWidget(checkbox)
-        frame_layout.addWidget(frame_info_widget, 1)  # Give the info widget stretch
-        
-        # Store widget reference
-        self.frame_widgets[frame_id] = {
-            'widget': frame_widget,
-            'checkbox': checkbox,
-            'label': id_label,
-            'frame_data': frame  # Store the frame data for easy access
-        }
-        
-        return frame_widget
-    
-    def _on_frame_clicked(self, event, frame):
+        return len(self.frame_model.checked_rows)
+    
+    def _on_frame_clicked(self, index):
         """
         Handle frame click for preview.
         
         Args:
-            event: Mouse event
-            frame: Frame data dictionary
+            index: Model index of the clicked frame
         """
         # Emit signal with the frame data to request a preview
-        self.framePreviewRequested.emit(frame)
+        self.framePreviewRequested.emit(dict(self.frames[index.row()]))
     
-    def _on_frame_selected(self, frame_id, state):
+    def _on_frame_data_changed(self, top_left, bottom_right, roles=()):
         """
-        Handle frame selection change.
+        Forward check state changes from the model as selectionChanged.
         
         Args:
-            frame_id: ID of the frame
-            state: Checkbox state
+            top_left: First changed index
+            bottom_right: Last changed index
+            roles: Changed data roles
         """
-        if state == Qt.Checked:
-            if frame_id not in self.selected_frames:
-                self.selected_frames.append(frame_id)
-        else:
-            if frame_id in self.selected_frames:
-                self.selected_frames.remove(frame_id)
-        
-        # Emit signal
-        self.selectionChanged.emit()
+        if not roles or Qt.CheckStateRole in roles:
+            self.selectionChanged.emit()
     
     def select_all(self):
         """Select all frames."""
-        self.selected_frames = [frame['id'] for frame in self.frames]
-        
-        # Update checkboxes
-        for frame_id, widgets in self.frame_widgets.items():
-            widgets['checkbox'].setChecked(True)
-        
-        # Emit signal
-        self.selectionChanged.emit()
+        self.frame_model.set_checked_rows(set(range(len(self.frames))))
     
     def deselect_all(self):
         """Deselect all frames."""
-        self.selected_frames = []
-        
-        # Update checkboxes
-        for frame_id, widgets in self.frame_widgets.items():
-            widgets['checkbox'].setChecked(False)
-        
-        # Emit signal
-        self.selectionChanged.emit()
+        self.frame_model.set_checked_rows(set())
     
     def invert_selection(self):
         """Invert the current selection."""
-        all_frame_ids = [frame['id'] for frame in self.frames]
-        self.selected_frames = [fid for fid in all_frame_ids if fid not in self.selected_frames]
-        
-        # Update checkboxes
-        for frame_id, widgets in self.frame_widgets.items():
-            widgets['checkbox'].setChecked(frame_id in self.selected_frames)
-        
-        # Emit signal
-        self.selectionChanged.emit()
+        self.frame_model.set_checked_rows(set(range(len(self.frames))) - self.frame_model.checked_rows)
     
     def get_selected_frames(self):
         """
-        Get the selected frames.
+        Get the selected frames, in frame order.
         
         Returns:
             List[Dict[str, Any]]: List of selected frame information dictionaries
         """
-        selected = []
+        return [self.frames[row] for row in sorted(self.frame_model.checked_rows)]
+    
+    def set_frame_previews_batch(self, previews):
+        """
+        Set preview images for many frames at once.
+        
+        Grayscale images of the same shape and dtype are downscaled together
+        in one vectorized pass, and the view is relaid out once at the end.
+        Other images go through the single-frame conversion.
+        
+        Args:
+            previews: Dictionary mapping frame IDs to image data arrays
+        """
+        groups = {}
+        pixmaps = {}
+        for frame_id, image_data in previews.items():
+            row = self.frame_model.row_of(frame_id)
+            if row is None or not isinstance(image_data, np.ndarray) or image_data.size == 0:
+                continue
+            if image_data.ndim == 2:
+                groups.setdefault((image_data.shape, image_data.dtype.str), []).append((row, image_data))
+            else:
+                pixmap = _preview_pixmap(image_data)
+                if pixmap is not None:
+                    pixmaps[row] = pixmap
+        
+        for entries in groups.values():
+            small = _downscale_stack(np.stack([image_data for _, image_data in entries]))
+            height, width = small.shape[1:]
+            for (row, _), image in zip(entries, small):
+                qimage = QImage(image.data, width, height, image.strides[0], QImage.Format_Grayscale8)
+                if height > PREVIEW_SIZE or width > PREVIEW_SIZE:
+                    qimage = qimage.scaled(PREVIEW_SIZE, PREVIEW_SIZE, Qt.KeepAspectRatio, Qt.FastTransformation)
+                pixmaps[row] = QPixmap.fromImage(qimage)
+        
+        self._apply_previews(pixmaps)
+    
+    def _apply_previews(self, pixmaps):
+        """
+        Hand preview pixmaps to the model.
         
-        for frame in self.frames:
-            if frame['id'] in self.selected_frames:
-                selected.append(frame)
+        Items grow to make room for previews once the first one arrives, so
+        the view lays its items out again then.
         
-        return selected
+        Args:
+            pixmaps: Preview pixmaps by row
+        """
+        first_preview = not self.frame_model.previews
+        self.frame_model.set_previews(pixmaps)
+        if first_preview and self.frame_model.previews:
+            self.list_view.doItemsLayout()
     
     def set_frame_preview(self, frame_id, image_data):
         """
@@ -268,30 +457,21 @@ class FrameSelector(QWidget):
             frame_id: ID of the frame
             image_data: Image data as numpy array
         """
-        if frame_id not in self.frame_widgets:
+        row = self.frame_model.row_of(frame_id)
+        if row is None:
             return
         
-        widgets = self.frame_widgets[frame_id]
-        
-        # Convert image data to QPixmap
+        # Convert image data to QPixmap, reusing the pixmap of identical content
         if isinstance(image_data, np.ndarray):
-            # Convert numpy array to PIL Image
-            image = Image.fromarray(image_data)
-            
-            # Convert PIL Image to QPixmap
-            img_buffer = io.BytesIO()
-            image.save(img_buffer, format='PNG')
-            img_buffer.seek(0)
-            
-            pixmap = QPixmap()
-            pixmap.loadFromData(img_buffer.getvalue())
-            
-            # Create or update image label
-            if 'image' not in widgets:
-                image_label = QLabel()
-                image_label.setFixedSize(100, 100)
-                image_label.setScaledContents(True)
-                widgets['layout'].insertWidget(1, image_label)
-                widgets['image'] = image_label
-            
-            widgets['image'].setPixmap(pixmap)
+            key = (frame_id, image_data.shape, image_data.dtype.str, _content_hash(image_data))
+            pixmap = self._preview_cache.get(key)
+            if pixmap is not None:
+                self._preview_cache.move_to_end(key)
+            else:
+                pixmap = _preview_pixmap(image_data)
+                if pixmap is None:
+                    return
+                self._preview_cache[key] = pixmap
+                if len(self._preview_cache) > self._PREVIEW_CACHE_MAX:
+                    self._preview_cache.popitem(last=False)
+            self._apply_previews({row: pixmap})
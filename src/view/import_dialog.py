@@ -8,9 +8,22 @@ Dialog for importing OCT files.
 """
 
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
-                           QPushButton, QFileDialog, QListWidget, QCheckBox,
-                           QGroupBox)
-from PyQt5.QtCore import Qt
+                           QPushButton, QFileDialog, QListView, QCheckBox,
+                           QGroupBox, QAbstractItemView)
+from PyQt5.QtCore import Qt, QStringListModel
+
+# File dialog filters; the first entry includes all supported formats
+_OCT_FILE_FILTERS = (
+    "All Supported OCT Files (*.e2e *.E2E *.img *.IMG *.fds *.FDS *.fda *.FDA *.oct *.OCT *.poct *.POCT *.dcm *.DCM)",
+    "Heidelberg OCT (*.e2e *.E2E)",
+    "Zeiss Cirrus OCT (*.img *.IMG)",
+    "Topcon OCT (*.fds *.FDS *.fda *.FDA)",
+    "Bioptigen OCT (*.oct *.OCT)",
+    "POCT Files (*.poct *.POCT)",
+    "DICOM Files (*.dcm *.DCM)",
+    "All Files (*)"
+)
+_OCT_FILTER_STR = ";;".join(_OCT_FILE_FILTERS)
 
 class ImportDialog(QDialog):
     """Dialog for importing OCT files."""
@@ -20,6 +33,7 @@ class ImportDialog(QDialog):
         super().__init__(parent)
         
         self.selected_files = []
+        self._last_filter = _OCT_FILE_FILTERS[0]
         
         # Setup UI
         self.init_ui()
@@ -44,8 +58,13 @@ class ImportDialog(QDialog):
         
         main_layout.addLayout(file_layout)
         
-        # File list
-        self.file_list = QListWidget()
+        # File list: a view over a string list model, so no item objects are
+        # created per file
+        self.file_model = QStringListModel(self)
+        self.file_list = QListView()
+        self.file_list.setModel(self.file_model)
+        self.file_list.setUniformItemSizes(True)
+        self.file_list.setEditTriggers(QAbstractItemView.NoEditTriggers)
         main_layout.addWidget(self.file_list)
         
         # Show supported formats
@@ -93,35 +112,22 @@ class ImportDialog(QDialog):
     
     def browse_files(self):
         """Browse for files to import."""
-        # Include all supported formats by default
-        filters = [
-            "All Supported OCT Files (*.e2e *.E2E *.img *.IMG *.fds *.FDS *.fda *.FDA *.oct *.OCT *.poct *.POCT *.dcm *.DCM)",
-            "Heidelberg OCT (*.e2e *.E2E)",
-            "Zeiss Cirrus OCT (*.img *.IMG)",
-            "Topcon OCT (*.fds *.FDS *.fda *.FDA)",
-            "Bioptigen OCT (*.oct *.OCT)",
-            "POCT Files (*.poct *.POCT)",
-            "DICOM Files (*.dcm *.DCM)",
-            "All Files (*)"
-        ]
-        
-        filter_str = ";;".join(filters)
-        
-        # Open file dialog
-        files, _ = QFileDialog.getOpenFileNames(
+        # Open file dialog, starting from the filter picked last time
+        files, selected_filter = QFileDialog.getOpenFileNames(
             self,
             "Select OCT Files",
             "",
-            filter_str
+            _OCT_FILTER_STR,
+            self._last_filter
         )
+        if selected_filter:
+            self._last_filter = selected_filter
         
         if files:
             self.selected_files = files
             
-            # Update file list
-            self.file_list.clear()
-            for file_path in files:
-                self.file_list.addItem(file_path)
+            # Update file list with a single model reset
+            self.file_model.setStringList(files)
             
             # Update label
             if len(files) == 1:
@@ -10,25 +10,156 @@ Dialog for configuring application settings and cropping parameters.
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                            QPushButton, QGroupBox, QGridLayout, QSpinBox,
                            QCheckBox, QLineEdit, QComboBox)
-from PyQt5.QtCore import Qt
-import json
+from PyQt5.QtCore import Qt, QRunnable, QThreadPool, QTimer, pyqtSignal
 import os
+import threading
+import uuid
+import logging
+from pathlib import Path
+
+from model.json_utils import json_dumps as _json_dumps, json_loads as _json_loads
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; settings stay in the two JSON files without it
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+# Settings live in <repo>/settings, resolved once at import; the directory is
+# created by the writer on the first save, so a read-only install still imports
+_SETTINGS_DIR = Path(__file__).resolve().parents[2] / "settings"
+_SETTINGS_FILE = _SETTINGS_DIR / "settings.json"
+_PRESETS_FILE = _SETTINGS_DIR / "presets.json"
+# Combined settings + presets file used when msgpack is installed
+_STATE_FILE = _SETTINGS_DIR / "state.msgpack"
+
+# Bytes queued for writing but not yet on disk, by path; loads read these
+# first so a dialog reopened right after Save sees the saved values
+_pending_writes = {}
+_pending_lock = threading.Lock()
+
+# Single writer thread so saves land on disk in the order they were made
+_writer_pool = None
+
+
+def _read_settings_bytes(path):
+    """Read a settings file, preferring bytes still waiting to be written."""
+    with _pending_lock:
+        data = _pending_writes.get(str(path))
+    if data is not None:
+        return data
+    return path.read_bytes()
+
+
+def _start_settings_write(files):
+    """
+    Queue settings files for writing on the single settings writer thread.
+    
+    Args:
+        files: List of (path, bytes) pairs to write
+    """
+    global _writer_pool
+    if _writer_pool is None:
+        _writer_pool = QThreadPool()
+        _writer_pool.setMaxThreadCount(1)
+    with _pending_lock:
+        for path, data in files:
+            _pending_writes[path] = data
+    _writer_pool.start(_SettingsWriter(files))
+
+
+def wait_for_settings_writes():
+    """Block until every queued settings write has reached disk."""
+    if _writer_pool is not None:
+        _writer_pool.waitForDone()
+
+
+class _SettingsWriter(QRunnable):
+    """Writes serialized settings files atomically on the settings writer thread."""
+    
+    def __init__(self, files):
+        """
+        Initialize the writer.
+        
+        Args:
+            files: List of (path, bytes) pairs to write
+        """
+        super().__init__()
+        self.files = files
+    
+    def run(self):
+        for path, data in self.files:
+            fd = -1
+            tmp_path = None
+            try:
+                # Write to a temporary file in the same directory, then rename it
+                # over the target so a crash never leaves a half-written file
+                directory = os.path.dirname(path)
+                os.makedirs(directory, exist_ok=True)
+                tmp_path = os.path.join(directory, f".tmp_{uuid.uuid4().hex}")
+                # Created with 0666 so the process umask applies, as for a plain open()
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+                
+                # Keep the permissions of the file being replaced
+                try:
+                    os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+                except FileNotFoundError:
+                    pass
+                
+                view = memoryview(data)
+                while view:
+                    written = os.write(fd, view)
+                    view = view[written:]
+                os.fsync(fd)
+                os.close(fd)
+                fd = -1
+                os.replace(tmp_path, path)
+            except Exception as e:
+                logger.error(f"Error saving settings to {path}: {e}")
+                if fd >= 0:
+                    os.close(fd)
+                if tmp_path is not None:
+                    try:
+                        os.remove(tmp_path)
+                    except OSError:
+                        pass
+            finally:
+                # Drop the pending bytes unless a newer save replaced them
+                with _pending_lock:
+                    if _pending_writes.get(path) is data:
+                        del _pending_writes[path]
+
 
 class SettingsDialog(QDialog):
     """Dialog for configuring application settings."""
     
+    # Emitted once after a preset's crop values are applied, with the preset
+    presetLoaded = pyqtSignal(dict)
+    
+    # Crop spin boxes mirrored between this dialog and the parent window
+    _MIRROR_SPIN_BOXES = ('crop_top', 'crop_left', 'crop_width', 'crop_height')
+    # All parent window widgets the dialog reads from or writes to
+    _MIRROR_ATTRS = ('crop_checkbox',) + _MIRROR_SPIN_BOXES + ('format_combo',)
+    
     def __init__(self, parent=None):
         """Initialize the settings dialog."""
         super().__init__(parent)
         
         self.settings = {}
         self.presets = {}
+        self._loaded = False  # Set once settings and presets are read from disk
         
-        # Load existing settings and presets
-        self.load_settings()
+        # Look up the parent's mirrored widgets once; None where it has none
+        parent_widget = self.parent()
+        self._parent_attrs = {name: getattr(parent_widget, name, None) for name in self._MIRROR_ATTRS}
         
         # Setup UI
         self.init_ui()
+        
+        # Load existing settings and presets once the dialog is up, so opening
+        # it doesn't wait on the settings files
+        QTimer.singleShot(0, self._deferred_load)
     
     def init_ui(self):
         """Initialize the user interface."""
@@ -42,8 +173,8 @@ class SettingsDialog(QDialog):
         crop_layout = QVBoxLayout(crop_group)
         
         self.crop_checkbox = QCheckBox("Enable cropping")
-        if hasattr(self.parent(), 'crop_checkbox'):
-            self.crop_checkbox.setChecked(self.parent().crop_checkbox.isChecked())
+        if self._parent_attrs['crop_checkbox'] is not None:
+            self.crop_checkbox.setChecked(self._parent_attrs['crop_checkbox'].isChecked())
         crop_layout.addWidget(self.crop_checkbox)
         
         crop_params_layout = QGridLayout()
@@ -51,33 +182,31 @@ class SettingsDialog(QDialog):
         crop_params_layout.addWidget(QLabel("Top:"), 0, 0)
         self.crop_top = QSpinBox()
         self.crop_top.setRange(0, 10000)
-        if hasattr(self.parent(), 'crop_top'):
-            self.crop_top.setValue(self.parent().crop_top.value())
         crop_params_layout.addWidget(self.crop_top, 0, 1)
         
         crop_params_layout.addWidget(QLabel("Left:"), 1, 0)
         self.crop_left = QSpinBox()
         self.crop_left.setRange(0, 10000)
-        if hasattr(self.parent(), 'crop_left'):
-            self.crop_left.setValue(self.parent().crop_left.value())
         crop_params_layout.addWidget(self.crop_left, 1, 1)
         
         crop_params_layout.addWidget(QLabel("Width:"), 2, 0)
         self.crop_width = QSpinBox()
         self.crop_width.setRange(1, 10000)
-        if hasattr(self.parent(), 'crop_width'):
-            self.crop_width.setValue(self.parent().crop_width.value())
         crop_params_layout.addWidget(self.crop_width, 2, 1)
         
         crop_params_layout.addWidget(QLabel("Height:"), 3, 0)
         self.crop_height = QSpinBox()
         self.crop_height.setRange(1, 10000)
-        if hasattr(self.parent(), 'crop_height'):
-            self.crop_height.setValue(self.parent().crop_height.value())
         crop_params_layout.addWidget(self.crop_height, 3, 1)
         
         crop_layout.addLayout(crop_params_layout)
         
+        # Start from the parent window's crop values
+        for name in self._MIRROR_SPIN_BOXES:
+            source = self._parent_attrs[name]
+            if source is not None:
+                getattr(self, name).setValue(source.value())
+        
         # Preset management
         preset_layout = QHBoxLayout()
         
@@ -110,7 +239,7 @@ class SettingsDialog(QDialog):
         
         # Auto-save settings
         self.auto_save = QCheckBox("Auto-save settings on exit")
-        self.auto_save.setChecked(self.settings.get('auto_save', True))
+        self.auto_save.setChecked(True)
         app_layout.addWidget(self.auto_save)
         
         # Default export format
@@ -119,7 +248,6 @@ class SettingsDialog(QDialog):
         
         self.default_format = QComboBox()
         self.default_format.addItems(["PNG", "JPEG", "TIFF", "DICOM"])
-        self.default_format.setCurrentText(self.settings.get('default_format', "PNG"))
         format_layout.addWidget(self.default_format)
         
         app_layout.addLayout(format_layout)
@@ -170,41 +298,96 @@ class SettingsDialog(QDialog):
         if index <= 0:
             return
         
+        self._ensure_loaded()
         preset_name = self.preset_combo.currentText()
         if preset_name in self.presets:
             preset = self.presets[preset_name]
             
-            self.crop_top.setValue(preset.get('top', 0))
-            self.crop_left.setValue(preset.get('left', 0))
-            self.crop_width.setValue(preset.get('width', 100))
-            self.crop_height.setValue(preset.get('height', 100))
+            # Apply all four values silently, then notify listeners once
+            for spin_box, key, default in ((self.crop_top, 'top', 0),
+                                           (self.crop_left, 'left', 0),
+                                           (self.crop_width, 'width', 100),
+                                           (self.crop_height, 'height', 100)):
+                spin_box.blockSignals(True)
+                spin_box.setValue(preset.get(key, default))
+                spin_box.blockSignals(False)
+            self.presetLoaded.emit(preset)
+    
+    def _deferred_load(self):
+        """Load settings and presets and show them in the dialog, unless already done."""
+        if self._loaded:
+            return
+        self.load_settings()
+        self._apply_loaded_settings()
+    
+    def _ensure_loaded(self):
+        """
+        Read settings and presets now if the deferred load has not run yet.
+        
+        Only the data is loaded; the widgets keep whatever the user has
+        already entered.
+        """
+        if not self._loaded:
+            self.load_settings()
+    
+    def _apply_loaded_settings(self):
+        """Populate the widgets from the loaded settings and presets."""
+        self.auto_save.setChecked(self.settings.get('auto_save', True))
+        self.default_format.setCurrentText(self.settings.get('default_format', "PNG"))
+        self.update_preset_combo()
     
     def load_settings(self):
         """Load settings and presets from file."""
-        settings_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "settings")
-        os.makedirs(settings_dir, exist_ok=True)
+        self.settings, self.presets = self._read_settings_from_disk()
+        self._loaded = True
+    
+    def _read_settings_from_disk(self):
+        """
+        Read settings and presets from their files.
+        
+        With msgpack installed both come from one state file; the JSON files
+        are only read when that file doesn't exist yet, and the next save
+        migrates them.
         
-        settings_file = os.path.join(settings_dir, "settings.json")
-        presets_file = os.path.join(settings_dir, "presets.json")
+        Returns:
+            Tuple[Dict[str, Any], Dict[str, Any]]: (Settings, Presets); empty if missing or unreadable
+        """
+        settings = {}
+        presets = {}
         
-        # Load settings
-        if os.path.exists(settings_file):
+        if msgpack is not None:
             try:
-                with open(settings_file, 'r') as f:
-                    self.settings = json.load(f)
-            except:
-                self.settings = {}
+                payload = msgpack.unpackb(_read_settings_bytes(_STATE_FILE), raw=False)
+            except FileNotFoundError:
+                payload = None
+            except Exception as e:
+                logger.warning(f"Could not read {_STATE_FILE}: {e}")
+                payload = {}
+            if payload is not None:
+                if not isinstance(payload, dict):
+                    payload = {}
+                return payload.get('settings', {}), payload.get('presets', {})
+        
+        # Load settings; a missing file just means defaults
+        try:
+            settings = _json_loads(_read_settings_bytes(_SETTINGS_FILE))
+        except (OSError, ValueError):
+            settings = {}
         
         # Load presets
-        if os.path.exists(presets_file):
-            try:
-                with open(presets_file, 'r') as f:
-                    self.presets = json.load(f)
-            except:
-                self.presets = {}
+        try:
+            presets = _json_loads(_read_settings_bytes(_PRESETS_FILE))
+        except (OSError, ValueError):
+            presets = {}
+        
+        return settings, presets
     
     def save_settings(self):
         """Save settings and presets to file."""
+        # Saving before the deferred load ran would overwrite the stored
+        # settings and presets with empty defaults
+        self._ensure_loaded()
+        
         # Update settings
         self.settings['auto_save'] = self.auto_save.isChecked()
         self.settings['default_format'] = self.default_format.currentText()
@@ -221,41 +404,32 @@ class SettingsDialog(QDialog):
                 }
         
         # Write to files
-        settings_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "settings")
-        os.makedirs(settings_dir, exist_ok=True)
-        
-        settings_file = os.path.join(settings_dir, "settings.json")
-        presets_file = os.path.join(settings_dir, "presets.json")
-        
+        # Serialize here, write on the writer thread so a slow disk doesn't block the dialog
         try:
-            with open(settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=4)
-            
-            with open(presets_file, 'w') as f:
-                json.dump(self.presets, f, indent=4)
+            if msgpack is not None:
+                payload = {'settings': self.settings, 'presets': self.presets}
+                files = [(str(_STATE_FILE), msgpack.packb(payload, use_bin_type=True))]
+            else:
+                files = [(str(_SETTINGS_FILE), _json_dumps(self.settings)),
+                         (str(_PRESETS_FILE), _json_dumps(self.presets))]
         except Exception as e:
-            print(f"Error saving settings: {str(e)}")
+            logger.error(f"Error saving settings: {e}")
+        else:
+            _start_settings_write(files)
         
         # Update parent window if available
-        if self.parent():
-            if hasattr(self.parent(), 'crop_checkbox'):
-                self.parent().crop_checkbox.setChecked(self.crop_checkbox.isChecked())
-            
-            if hasattr(self.parent(), 'crop_top'):
-                self.parent().crop_top.setValue(self.crop_top.value())
-            
-            if hasattr(self.parent(), 'crop_left'):
-                self.parent().crop_left.setValue(self.crop_left.value())
-            
-            if hasattr(self.parent(), 'crop_width'):
-                self.parent().crop_width.setValue(self.crop_width.value())
-            
-            if hasattr(self.parent(), 'crop_height'):
-                self.parent().crop_height.setValue(self.crop_height.value())
-            
-            if hasattr(self.parent(), 'format_combo'):
-                index = self.parent().format_combo.findText(self.default_format.currentText())
-                if index >= 0:
-                    self.parent().format_combo.setCurrentIndex(index)
+        if self._parent_attrs['crop_checkbox'] is not None:
+            self._parent_attrs['crop_checkbox'].setChecked(self.crop_checkbox.isChecked())
+        
+        for name in self._MIRROR_SPIN_BOXES:
+            target = self._parent_attrs[name]
+            if target is not None:
+                target.setValue(getattr(self, name).value())
+        
+        format_combo = self._parent_attrs['format_combo']
+        if format_combo is not None:
+            index = format_combo.findText(self.default_format.currentText())
+            if index >= 0:
+                format_combo.setCurrentIndex(index)
         
         self.accept()
@@ -2,36 +2,69 @@
 # -*- coding: utf-8 -*-
 
 import os
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-import numpy as np
 from PIL import Image
-import matplotlib.pyplot as plt
 from src.model.oct_file_reader import OCTFileReader
+from src.model._normalize_kernels import minmax
 
-# Configure logging
+# Configure logging: callers only enqueue records, a listener thread does the writes
+log_queue = queue.Queue(-1)
 logging.basicConfig(
     level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('test_extraction.log')
-    ]
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+stream_handler = logging.StreamHandler(sys.stdout)
+stream_handler.setFormatter(log_formatter)
+file_handler = logging.FileHandler('test_extraction.log')
+file_handler.setFormatter(log_formatter)
+log_listener = logging.handlers.QueueListener(
+    log_queue, stream_handler, file_handler, respect_handler_level=True
+)
+log_listener.start()
+atexit.register(log_listener.stop)
 logger = logging.getLogger('test_extraction')
 
-def test_oct_extraction(file_path):
+def extract_frame(oct_reader, file_name, frame_id):
+    """Extract one frame image, save it as PNG and log its value range"""
+    logger.info("Extracting image for frame %s...", frame_id)
+    
+    image_data = oct_reader.get_frame_image(file_name, frame_id)
+    
+    if image_data is not None:
+        logger.info("Successfully extracted image with shape: %s, dtype: %s", image_data.shape, image_data.dtype)
+        
+        # Save the image
+        output_path = f"extracted_{file_name}_{frame_id}.png"
+        # fromarray keeps uint16 frames as 'I;16'; fast deflate level,
+        # the default level 6 dominates the save time
+        img = Image.fromarray(image_data)
+        img.save(output_path, format='PNG', compress_level=1, optimize=False)
+        logger.info("Saved image to %s", output_path)
+        
+        # Display basic image information
+        min_value, max_value = minmax(image_data)
+        logger.info("Image min value: %s, max value: %s", min_value, max_value)
+    else:
+        logger.error("Failed to extract image for frame %s", frame_id)
+
+def test_oct_extraction(file_path, parallel=True):
     """Test the OCT file extraction functionality"""
     # Convert to absolute path if not already
     file_path = os.path.abspath(file_path)
-    logger.info(f"Testing OCT extraction with absolute file path: {file_path}")
+    logger.info("Testing OCT extraction with absolute file path: %s", file_path)
     
     # Check if file exists
     if not os.path.exists(file_path):
-        logger.error(f"File does not exist: {file_path}")
+        logger.error("File does not exist: %s", file_path)
         return
-        
+    
     # Create OCTFileReader instance
     oct_reader = OCTFileReader()
     
@@ -43,31 +76,31 @@ def test_oct_extraction(file_path):
         logger.info("Loading OCT file...")
         success, message = oct_reader.load_file(file_path)
         if not success:
-            logger.error(f"Failed to load file: {message}")
+            logger.error("Failed to load file: %s", message)
             return
-        logger.info(f"OCT file loaded successfully: {message}")
+        logger.info("OCT file loaded successfully: %s", message)
         
         # The OCTFileReader extracts the filename from the path internally
         # Let's get the file name from the reader's mappings
         file_name = os.path.basename(file_path)  # This should match what the reader uses
     except Exception as e:
-        logger.error(f"Error loading file: {str(e)}", exc_info=True)
+        logger.error("Error loading file: %s", e, exc_info=True)
         return
     
     # Get available frames
     try:
         logger.info("Getting available frames...")
         frames = oct_reader.get_frames(file_name)
-        logger.info(f"Found {len(frames)} frames")
+        logger.info("Found %d frames", len(frames))
         
         # Print frame information
         for i, frame in enumerate(frames[:5]):  # Print info for first 5 frames
-            logger.info(f"Frame {i} info: {frame}")
+            logger.info("Frame %d info: %s", i, frame)
         
         if len(frames) > 5:
-            logger.info(f"... and {len(frames) - 5} more frames")
+            logger.info("... and %d more frames", len(frames) - 5)
     except Exception as e:
-        logger.error(f"Error getting frames: {str(e)}", exc_info=True)
+        logger.error("Error getting frames: %s", e, exc_info=True)
         return
     
     # Extract some frame images
@@ -77,40 +110,38 @@ def test_oct_extraction(file_path):
             frames_to_extract = [0]
             if len(frames) > 10:
                 frames_to_extract.append(len(frames) // 2)
-                
-            for idx in frames_to_extract:
-                frame = frames[idx]
-                frame_id = frame['id']
-                logger.info(f"Extracting image for frame {frame_id}...")
-                
-                image_data = oct_reader.get_frame_image(file_name, frame_id)
-                
-                if image_data is not None:
-                    logger.info(f"Successfully extracted image with shape: {image_data.shape}, dtype: {image_data.dtype}")
-                    
-                    # Save the image
-                    output_path = f"extracted_{file_name}_{frame_id}.png"
-                    img = Image.fromarray(image_data)
-                    img.save(output_path)
-                    logger.info(f"Saved image to {output_path}")
-                    
-                    # Display basic image information
-                    logger.info(f"Image min value: {image_data.min()}, max value: {image_data.max()}")
-                else:
-                    logger.error(f"Failed to extract image for frame {frame_id}")
+            
+            frame_ids = [frames[idx]['id'] for idx in frames_to_extract]
+            if parallel and len(frame_ids) > 1:
+                # Decoding and PNG encoding release the GIL, so one frame's
+                # decode overlaps the other's save
+                with ThreadPoolExecutor(max_workers=len(frame_ids)) as executor:
+                    futures = [
+                        executor.submit(extract_frame, oct_reader, file_name, frame_id)
+                        for frame_id in frame_ids
+                    ]
+                    for future in as_completed(futures):
+                        future.result()
+            else:
+                for frame_id in frame_ids:
+                    extract_frame(oct_reader, file_name, frame_id)
         except Exception as e:
-            logger.error(f"Error extracting frame images: {str(e)}", exc_info=True)
+            logger.error("Error extracting frame images: %s", e, exc_info=True)
 
 def main():
+    # --no-parallel extracts frames one at a time, for debugging
+    args = [arg for arg in sys.argv[1:] if arg != '--no-parallel']
+    parallel = len(args) == len(sys.argv) - 1
+    
     # Check if command line argument was provided
-    if len(sys.argv) > 1:
-        file_path = sys.argv[1]
-        logger.info(f"Using file path from command line: {file_path}")
+    if args:
+        file_path = args[0]
+        logger.info("Using file path from command line: %s", file_path)
         if os.path.exists(file_path):
-            test_oct_extraction(file_path)
+            test_oct_extraction(file_path, parallel)
             return
         else:
-            logger.error(f"File not found: {file_path}")
+            logger.error("File not found: %s", file_path)
     
     # Look for OCT files in the current directory
     oct_files = []
@@ -126,15 +157,15 @@ def main():
         # Verify the file exists
         if os.path.exists(file_path):
             oct_files = [Path(file_path)]
-            logger.info(f"File found: {file_path}")
+            logger.info("File found: %s", file_path)
         else:
-            logger.error(f"File not found: {file_path}")
+            logger.error("File not found: %s", file_path)
             return
     
     # Test with the first OCT file found
     if oct_files:
-        logger.info(f"Found OCT files: {[str(f) for f in oct_files]}")
-        test_oct_extraction(str(oct_files[0]))
+        logger.info("Found OCT files: %s", [str(f) for f in oct_files])
+        test_oct_extraction(str(oct_files[0]), parallel)
     else:
         logger.error("No OCT files available for testing")
 
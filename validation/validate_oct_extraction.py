@@ -9,11 +9,11 @@ Script to validate extraction and processing accuracy for OCT files.
 
 import os
 import sys
-import numpy as np
-from PIL import Image
-import json
 import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
+from pathlib import Path
 
 # Add parent directory to path to import application modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -21,12 +21,51 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Import application modules
 from src.model import OCTFileReader, FileManager, ImageProcessor
 from src.controller import ImageController
+from src.model.json_utils import json_dumps
 
-def validate_file_loading(file_path):
+# Fast PNG deflate level for validation exports
+PNG_SAVE_OPTIONS = {'compress_level': 1}
+
+# Stateless helpers shared by all validations in this process
+image_processor = ImageProcessor()
+image_controller = ImageController(image_processor)
+file_manager = FileManager()
+
+# Processed first frame of each file, kept by validate_image_processing so
+# validate_export can save it without processing it again
+_processed_cache = {}
+
+def _center_crop_params(image_data):
+    """Crop parameters for the central half of an image."""
+    height, width = image_data.shape[:2]
+    return {
+        'top': height // 4,
+        'left': width // 4,
+        'width': width // 2,
+        'height': height // 2
+    }
+
+def _processing_params(image_data):
+    """
+    Rotate-and-crop parameters used by both the processing and export checks.
+    
+    Both checks must use the same parameters, since the export check saves
+    the image the processing check produced when it is cached.
+    """
+    return {
+        'rotation': 90,
+        'crop': True,
+        'crop_params': _center_crop_params(image_data)
+    }
+
+def validate_file_loading(oct_reader, file_path):
     """
     Validate file loading functionality.
     
+    Loads the file into oct_reader, which the other validators then reuse.
+    
     Args:
+        oct_reader: OCTFileReader to load the file into
         file_path: Path to the OCT file
         
     Returns:
@@ -42,9 +81,6 @@ def validate_file_loading(file_path):
     }
     
     try:
-        # Initialize OCT reader
-        oct_reader = OCTFileReader()
-        
         # Test file format detection
         test_result = {
             "name": "File format detection",
@@ -140,11 +176,13 @@ def validate_file_loading(file_path):
     
     return results
 
-def validate_image_processing(file_path):
+def validate_image_processing(oct_reader, image_controller, file_path):
     """
     Validate image processing functionality.
     
     Args:
+        oct_reader: OCTFileReader the file was loaded into
+        image_controller: ImageController to test
         file_path: Path to the OCT file
         
     Returns:
@@ -160,18 +198,10 @@ def validate_image_processing(file_path):
     }
     
     try:
-        # Initialize components
-        oct_reader = OCTFileReader()
-        image_processor = ImageProcessor()
-        image_controller = ImageController(image_processor)
-        
-        # Load file
-        success, message = oct_reader.load_file(file_path)
-        if not success:
-            results["errors"].append(message)
-            return results
-        
         file_name = os.path.basename(file_path)
+        if oct_reader.get_file_id(file_name) is None:
+            results["errors"].append("File not loaded")
+            return results
         
         # Get frames
         frames = oct_reader.get_frames(file_name)
@@ -230,13 +260,7 @@ def validate_image_processing(file_path):
         
         try:
             # Define crop parameters (use a small region in the center)
-            height, width = image_data.shape[:2]
-            crop_params = {
-                'top': height // 4,
-                'left': width // 4,
-                'width': width // 2,
-                'height': height // 2
-            }
+            crop_params = _center_crop_params(image_data)
             
             cropped_image = image_controller.crop_image(image_data, crop_params)
             if cropped_image is not None:
@@ -257,14 +281,9 @@ def validate_image_processing(file_path):
         }
         
         try:
-            processing_params = {
-                'rotation': 180,
-                'crop': True,
-                'crop_params': crop_params
-            }
-            
-            processed_image = image_controller.process_image(image_data, processing_params)
+            processed_image = image_controller.process_image(image_data, _processing_params(image_data))
             if processed_image is not None:
+                _processed_cache[file_path] = processed_image
                 test_result["success"] = True
                 test_result["details"] = f"Successfully processed image with rotation and cropping"
             else:
@@ -282,11 +301,14 @@ def validate_image_processing(file_path):
     
     return results
 
-def validate_export(file_path, export_dir):
+def validate_export(oct_reader, file_manager, image_controller, file_path, export_dir):
     """
     Validate export functionality.
     
     Args:
+        oct_reader: OCTFileReader the file was loaded into
+        file_manager: FileManager used to save the images
+        image_controller: ImageController used to process the image
         file_path: Path to the OCT file
         export_dir: Directory to export files to
         
@@ -303,22 +325,13 @@ def validate_export(file_path, export_dir):
     }
     
     try:
-        # Initialize components
-        oct_reader = OCTFileReader()
-        file_manager = FileManager()
-        image_processor = ImageProcessor()
-        image_controller = ImageController(image_processor)
-        
         # Create export directory if it doesn't exist
         os.makedirs(export_dir, exist_ok=True)
         
-        # Load file
-        success, message = oct_reader.load_file(file_path)
-        if not success:
-            results["errors"].append(message)
-            return results
-        
         file_name = os.path.basename(file_path)
+        if oct_reader.get_file_id(file_name) is None:
+            results["errors"].append("File not loaded")
+            return results
         
         # Get frames
         frames = oct_reader.get_frames(file_name)
@@ -326,93 +339,70 @@ def validate_export(file_path, export_dir):
             results["errors"].append("No frames found in file")
             return results
         
-        # Test PNG export
-        test_result = {
-            "name": "PNG export",
-            "success": False,
-            "details": ""
-        }
-        
-        try:
-            frame = frames[0]  # Use first frame for testing
-            frame_id = frame['id']
-            
-            image_data = oct_reader.get_frame_image(file_name, frame_id)
-            if image_data is None:
-                test_result["details"] = "Failed to extract image data"
-                results["tests"].append(test_result)
-                results["errors"].append("Failed to extract image data")
-                return results
-            
-            output_file = os.path.join(export_dir, f"{file_name}_{frame_id}.png")
-            success, message = file_manager.save_image(image_data, output_file, "PNG")
-            
-            if success and os.path.exists(output_file):
-                test_result["success"] = True
-                test_result["details"] = f"Successfully exported to PNG: {output_file}"
-            else:
-                test_result["details"] = f"Failed to export to PNG: {message}"
-        except Exception as e:
-            test_result["details"] = f"Error exporting to PNG: {str(e)}"
-        
-        results["tests"].append(test_result)
-        
-        # Test JPEG export
-        test_result = {
-            "name": "JPEG export",
-            "success": False,
-            "details": ""
-        }
-        
-        try:
-            output_file = os.path.join(export_dir, f"{file_name}_{frame_id}.jpg")
-            success, message = file_manager.save_image(image_data, output_file, "JPEG")
-            
-            if success and os.path.exists(output_file):
-                test_result["success"] = True
-                test_result["details"] = f"Successfully exported to JPEG: {output_file}"
-            else:
-                test_result["details"] = f"Failed to export to JPEG: {message}"
-        except Exception as e:
-            test_result["details"] = f"Error exporting to JPEG: {str(e)}"
-        
-        results["tests"].append(test_result)
+        # Extract the frame to export
+        frame = frames[0]  # Use first frame for testing
+        frame_id = frame['id']
         
-        # Test processed image export
-        test_result = {
-            "name": "Processed image export",
-            "success": False,
-            "details": ""
-        }
+        image_data = oct_reader.get_frame_image(file_name, frame_id)
+        if image_data is None:
+            results["tests"].append({
+                "name": "PNG export",
+                "success": False,
+                "details": "Failed to extract image data"
+            })
+            results["errors"].append("Failed to extract image data")
+            return results
         
-        try:
-            # Process image (rotate and crop)
-            height, width = image_data.shape[:2]
-            processing_params = {
-                'rotation': 90,
-                'crop': True,
-                'crop_params': {
-                    'top': height // 4,
-                    'left': width // 4,
-                    'width': width // 2,
-                    'height': height // 2
-                }
+        # Reuse the image processed by validate_image_processing, or
+        # process it here (rotate and crop) if that did not run or failed
+        processed_image = _processed_cache.pop(file_path, None)
+        processing_error = "Failed to process image"
+        if processed_image is None:
+            try:
+                processed_image = image_controller.process_image(image_data, _processing_params(image_data))
+            except Exception as e:
+                processing_error = str(e)
+        
+        # (test name, image, output file, format, PIL options, description)
+        exports = [
+            ("PNG export", image_data, os.path.join(export_dir, f"{file_name}_{frame_id}.png"),
+             "PNG", PNG_SAVE_OPTIONS, "to PNG"),
+            ("JPEG export", image_data, os.path.join(export_dir, f"{file_name}_{frame_id}.jpg"),
+             "JPEG", None, "to JPEG"),
+            ("Processed image export", processed_image,
+             os.path.join(export_dir, f"{file_name}_{frame_id}_processed.png"),
+             "PNG", PNG_SAVE_OPTIONS, "processed image"),
+        ]
+        
+        def run_export(export):
+            name, image, output_file, file_format, pil_kwargs, description = export
+            test_result = {
+                "name": name,
+                "success": False,
+                "details": ""
             }
             
-            processed_image = image_controller.process_image(image_data, processing_params)
-            
-            output_file = os.path.join(export_dir, f"{file_name}_{frame_id}_processed.png")
-            success, message = file_manager.save_image(processed_image, output_file, "PNG")
+            try:
+                if image is None:
+                    raise ValueError(processing_error)
+                success, message, _ = file_manager.save_image(
+                    image, output_file, file_format, pil_kwargs=pil_kwargs
+                )
+                
+                if success and os.path.exists(output_file):
+                    test_result["success"] = True
+                    test_result["details"] = f"Successfully exported {description}: {output_file}"
+                else:
+                    test_result["details"] = f"Failed to export {description}: {message}"
+            except Exception as e:
+                test_result["details"] = f"Error exporting {description}: {str(e)}"
             
-            if success and os.path.exists(output_file):
-                test_result["success"] = True
-                test_result["details"] = f"Successfully exported processed image: {output_file}"
-            else:
-                test_result["details"] = f"Failed to export processed image: {message}"
-        except Exception as e:
-            test_result["details"] = f"Error exporting processed image: {str(e)}"
+            return test_result
         
-        results["tests"].append(test_result)
+        # The encoders release the GIL, so the three saves run side by side;
+        # each writes its own file, so sharing the FileManager is safe
+        with ThreadPoolExecutor(max_workers=len(exports)) as executor:
+            results["tests"].extend(executor.map(run_export, exports))
         
         # Overall success
         results["success"] = all(test["success"] for test in results["tests"])
@@ -422,6 +412,37 @@ def validate_export(file_path, export_dir):
     
     return results
 
+def _validate_one(file_path, export_dir):
+    """
+    Run all validation tests for a single file.
+    
+    Top-level so it can be pickled for the process pool.
+    
+    Args:
+        file_path: Path to the OCT file
+        export_dir: Directory to export files to
+        
+    Returns:
+        dict: Validation results for the file
+    """
+    # Parse the file once and share the reader between the validators
+    oct_reader = OCTFileReader()
+    
+    file_results = {
+        "file": os.path.basename(file_path),
+        "loading": validate_file_loading(oct_reader, file_path),
+        "processing": validate_image_processing(oct_reader, image_controller, file_path),
+        "export": validate_export(oct_reader, file_manager, image_controller, file_path, export_dir)
+    }
+    
+    file_results["success"] = (
+        file_results["loading"]["success"] and
+        file_results["processing"]["success"] and
+        file_results["export"]["success"]
+    )
+    
+    return file_results
+
 def run_validation(test_files, export_dir):
     """
     Run validation tests on test files.
@@ -440,21 +461,12 @@ def run_validation(test_files, export_dir):
         "overall_success": False
     }
     
-    for file_path in test_files:
-        file_results = {
-            "file": os.path.basename(file_path),
-            "loading": validate_file_loading(file_path),
-            "processing": validate_image_processing(file_path),
-            "export": validate_export(file_path, export_dir)
-        }
-        
-        file_results["success"] = (
-            file_results["loading"]["success"] and
-            file_results["processing"]["success"] and
-            file_results["export"]["success"]
+    # Files are independent and the work is GIL-bound, so validate them in
+    # separate processes; map keeps the results in input order
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results["file_results"] = list(
+            executor.map(partial(_validate_one, export_dir=export_dir), test_files)
         )
-        
-        results["file_results"].append(file_results)
     
     # Overall success
     results["overall_success"] = all(file_result["success"] for file_result in results["file_results"])
@@ -481,12 +493,15 @@ def main():
     os.makedirs(test_dir, exist_ok=True)
     os.makedirs(export_dir, exist_ok=True)
     
-    # Find test files
-    test_files = []
-    for root, _, files in os.walk(test_dir):
-        for file in files:
-            if file.lower().endswith(('.e2e', '.img')):
-                test_files.append(os.path.join(root, file))
+    # Find test files in one walk, ignoring anything under the export directory
+    export_path = Path(export_dir).resolve()
+    test_files = sorted(
+        str(path)
+        for path in Path(test_dir).rglob('*')
+        if path.suffix.lower() in {'.e2e', '.img'}
+        and path.is_file()
+        and export_path not in path.resolve().parents
+    )
     
     if not test_files:
         print(f"No test files found in {test_dir}")
@@ -502,8 +517,8 @@ def main():
     results = run_validation(test_files, export_dir)
     
     # Save results
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(json_dumps(results))
     
     print(f"\nValidation results saved to {output_file}")
     
@@ -1,8 +1,23 @@
 import os
 import sys
 
-def check_file_exists(path, description):
-    if not os.path.exists(path):
+def _cache_scan(directory, scans):
+    # One scandir per directory; DirEntry caches its type, so the
+    # is_dir() checks below need no further stat calls
+    if directory not in scans:
+        try:
+            with os.scandir(directory or '.') as entries:
+                scans[directory] = {entry.name: entry for entry in entries}
+        except OSError:
+            scans[directory] = {}
+    return scans[directory]
+
+def _lookup(path, scans):
+    parent, name = os.path.split(path)
+    return _cache_scan(parent, scans).get(name)
+
+def check_file_exists(path, description, scans):
+    if _lookup(path, scans) is None:
         print(f"❌ {description} not found at: {path}")
         return False
     print(f"✓ {description} found")
@@ -20,9 +35,10 @@ def verify_build_environment():
         ("LICENSE", "License file")
     ]
     
+    scans = {}
     all_ok = True
     for file_path, description in required_files:
-        if not check_file_exists(file_path, description):
+        if not check_file_exists(file_path, description, scans):
             all_ok = False
     
     # Check Python version
@@ -37,7 +53,8 @@ def verify_build_environment():
     ]
     
     for dir_path, description in required_dirs:
-        if not os.path.isdir(dir_path):
+        entry = _lookup(dir_path, scans)
+        if entry is None or not entry.is_dir():
             print(f"❌ {description} directory not found: {dir_path}")
             all_ok = False
         else: